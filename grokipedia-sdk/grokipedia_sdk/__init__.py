@@ -1,10 +1,16 @@
 """Grokipedia SDK - A Python SDK for accessing Grokipedia content"""
 
-from .client import Client
+import importlib
+from typing import TYPE_CHECKING
+
 from .exceptions import GrokipediaError, ArticleNotFound, RequestError
 from .models import Article, ArticleSummary, Section, ArticleMetadata, SearchResult
-from .slug_index import SlugIndex
-from . import parsers
+
+if TYPE_CHECKING:
+    # Give type checkers and IDEs the real types of the lazily loaded names below
+    from . import parsers
+    from .client import Client
+    from .slug_index import SlugIndex
 
 __version__ = "1.1.0"
 __all__ = [
@@ -21,3 +27,26 @@ __all__ = [
     "parsers",
 ]
 
+# Names imported on first access, so importing the models or exceptions alone
+# doesn't pull in httpx, BeautifulSoup and the fuzzy-search stack
+_LAZY_ATTRS = {
+    "Client": (".client", "Client"),
+    "SlugIndex": (".slug_index", "SlugIndex"),
+    "parsers": (".parsers", None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
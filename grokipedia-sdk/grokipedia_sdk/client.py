@@ -3,12 +3,19 @@
 import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
-from typing import Optional, List, Union, Tuple
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Union, Tuple, Dict, Iterable
 from collections import OrderedDict
-from urllib.parse import quote
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from types import MappingProxyType
 import time
 import os
+import random
+import re
 import asyncio
+import functools
+import hashlib
+import weakref
 from threading import Lock
 
 from .models import Article, ArticleSummary, Section, ArticleMetadata
@@ -16,13 +23,347 @@ from .exceptions import ArticleNotFound, RequestError
 from .slug_index import SlugIndex
 from . import parsers
 
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 # Default configuration constants
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_CACHE_SIZE = 1000
 DEFAULT_RATE_LIMIT = 1.0
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5  # Shortest retry delay in seconds
+DEFAULT_BACKOFF_CAP = 30.0  # Longest retry delay in seconds, including Retry-After
 DEFAULT_TOC_LIMIT = 10
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MAX_CONNECTIONS = 256
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+DEFAULT_KEEPALIVE_EXPIRY = 15.0  # httpx default of 5s drops idle connections between polls
 DEFAULT_USER_AGENT = "GrokipediaSDK/1.0 (Python SDK; +https://github.com/AppleLamps/grokipedia-sdk)"
+DEFAULT_HEADERS = MappingProxyType({"User-Agent": DEFAULT_USER_AGENT})
+PAGE_PATH_TEMPLATE = "/page/%s"
+PARSE_OFFLOAD_THRESHOLD = 16 * 1024  # Pages smaller than this are always parsed inline
+PARSE_MEMO_SIZE = 64  # Parse results remembered per process, keyed by page digest
+PARSE_MEMO_MIN_LENGTH = 16 * 1024  # Smaller pages re-parse too quickly to be worth remembering
+DEFAULT_BASE_URL = "https://grokipedia.com"
+BASE_URL_ENV_VAR = "GROKIPEDIA_BASE_URL"
+SLUG_CACHE_SIZE = 2048  # Encoded slugs remembered per process; bounded against floods of unique slugs
+# Slugs made only of characters quote(slug, safe='_-') leaves untouched need no encoding
+SAFE_SLUG_PATTERN = re.compile(r'[A-Za-z0-9_.~-]+')
+# Percent-encoding of every UTF-8 byte value, matching quote(slug, safe='_-')
+_SLUG_QUOTE_TABLE = tuple(
+    chr(byte) if SAFE_SLUG_PATTERN.fullmatch(chr(byte)) else '%%%02X' % byte
+    for byte in range(256)
+)
+# str.translate map for ASCII slugs: only the characters that need escaping
+_SLUG_QUOTE_ASCII = {
+    byte: _SLUG_QUOTE_TABLE[byte] for byte in range(128) if _SLUG_QUOTE_TABLE[byte] != chr(byte)
+}
+
+# How the retry loops handle HTTP error statuses; unlisted statuses fail without retrying
+_STATUS_NOT_FOUND = "not_found"
+_STATUS_RATE_LIMITED = "rate_limited"
+_STATUS_RETRY = "retry"
+_STATUS_FAIL = "fail"
+_STATUS_ACTIONS = {404: _STATUS_NOT_FOUND, 408: _STATUS_RETRY, 429: _STATUS_RATE_LIMITED}
+_STATUS_ACTIONS.update(dict.fromkeys(range(500, 600), _STATUS_RETRY))
+
+# Errors that abort the fetching caller itself rather than the fetch; waiters
+# sharing that fetch retry instead of inheriting them
+_FETCH_ABORTS = (asyncio.CancelledError, KeyboardInterrupt, SystemExit)
+
+
+class _FetchAbandoned(Exception):
+    """Raised to callers waiting on a shared fetch whose leader was aborted."""
+
+
+def _parse_retry_after(value) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+    
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+        
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing or invalid
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@functools.lru_cache(maxsize=1)
+def _env_base_url() -> str:
+    """
+    Resolve the default base URL from the environment.
+    
+    The environment is read once per process; call ``_env_base_url.cache_clear()``
+    after changing GROKIPEDIA_BASE_URL at runtime.
+    
+    Returns:
+        Value of GROKIPEDIA_BASE_URL, or DEFAULT_BASE_URL when it is not set
+    """
+    return os.environ.get(BASE_URL_ENV_VAR, DEFAULT_BASE_URL)
+
+
+@functools.lru_cache(maxsize=SLUG_CACHE_SIZE)
+def _encode_slug(slug: str) -> str:
+    """
+    URL-encode a stripped, non-empty slug.
+    
+    Encoding is a pure function of the slug, so results are cached; callers
+    commonly request the article and then the summary for the same slug.
+    
+    Args:
+        slug: Slug with surrounding whitespace already removed
+        
+    Returns:
+        The slug with every byte outside ``[A-Za-z0-9_.~-]`` percent-encoded
+    """
+    # Typical slugs (letters, digits, underscores, hyphens) are already URL-safe
+    if SAFE_SLUG_PATTERN.fullmatch(slug):
+        return slug
+    
+    # URL encode to prevent injection and handle special characters safely
+    # Allow underscores and hyphens to pass through as-is (common in slugs)
+    if slug.isascii():
+        return slug.translate(_SLUG_QUOTE_ASCII)
+    return ''.join(map(_SLUG_QUOTE_TABLE.__getitem__, slug.encode('utf-8')))
+
+
+_DEFAULT_SLUG_INDEX: Optional[SlugIndex] = None
+_DEFAULT_SLUG_INDEX_LOCK = Lock()
+
+
+def _default_slug_index() -> SlugIndex:
+    """
+    Return the SlugIndex shared by all Clients created without one.
+    
+    The index is loaded from disk on first search, so sharing it means the
+    sitemap is parsed once per process rather than once per Client.
+    
+    Returns:
+        Process-wide default SlugIndex
+    """
+    global _DEFAULT_SLUG_INDEX
+    if _DEFAULT_SLUG_INDEX is None:
+        with _DEFAULT_SLUG_INDEX_LOCK:
+            if _DEFAULT_SLUG_INDEX is None:
+                _DEFAULT_SLUG_INDEX = SlugIndex()
+    return _DEFAULT_SLUG_INDEX
+
+
+class _ClientResources:
+    """
+    Connections and workers owned by a Client.
+    
+    Kept separate from Client so a weakref.finalize callback can close them
+    without holding a reference to the Client itself.
+    """
+    
+    def __init__(self):
+        self.http_client: Optional[httpx.Client] = None
+        self.http_async_client: Optional[httpx.AsyncClient] = None
+        self.parse_executor: Optional[ProcessPoolExecutor] = None
+    
+    def close(self) -> None:
+        """Close everything synchronously (safe to call more than once)"""
+        client, self.http_client = self.http_client, None
+        if client is not None:
+            client.close()
+        async_client, self.http_async_client = self.http_async_client, None
+        if async_client is not None:
+            # Run async cleanup in a way that works even from sync context
+            try:
+                # Try to get the running loop
+                loop = asyncio.get_running_loop()
+                # If we're here, a loop is running - schedule cleanup as a task
+                asyncio.create_task(async_client.aclose())
+            except RuntimeError:
+                # No event loop is running, run cleanup synchronously
+                try:
+                    asyncio.run(async_client.aclose())
+                except RuntimeError:
+                    # If asyncio.run() fails, try the legacy approach
+                    loop = asyncio.new_event_loop()
+                    try:
+                        loop.run_until_complete(async_client.aclose())
+                    finally:
+                        loop.close()
+        executor, self.parse_executor = self.parse_executor, None
+        if executor is not None:
+            executor.shutdown()
+    
+    async def aclose(self) -> None:
+        """Close everything, awaiting the async client"""
+        client, self.http_client = self.http_client, None
+        if client is not None:
+            client.close()
+        async_client, self.http_async_client = self.http_async_client, None
+        if async_client is not None:
+            await async_client.aclose()
+        executor, self.parse_executor = self.parse_executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def _finalize_resources(resources: _ClientResources) -> None:
+    """Garbage-collection callback for Clients that were never closed"""
+    try:
+        resources.close()
+    except Exception:
+        pass  # Nothing useful can be done with errors during collection
+
+
+def _parse_article_html(
+    html: str, slug: str, url: str, full_content: bool = True
+) -> Union[Article, ArticleSummary]:
+    """
+    Parse HTML content into Article or ArticleSummary object.
+    
+    Defined at module level so it can be shipped to a worker process.
+    
+    Args:
+        html: HTML content to parse
+        slug: Article slug
+        url: Article URL
+        full_content: If True, parse full article; if False, parse summary only
+        
+    Returns:
+        Article object if full_content=True, ArticleSummary otherwise
+    """
+    if not full_content:
+        # Most pages can be summarized without building a parse tree; the rest
+        # are queried with XPath on an lxml tree before falling back to BeautifulSoup
+        fast_result = parsers.extract_summary_fast(html) or parsers.extract_summary_lxml(html)
+        if fast_result is not None:
+            title, summary, toc = fast_result
+            return ArticleSummary(
+                title=title if title is not None else slug.replace('_', ' '),
+                slug=slug,
+                url=url,
+                summary=summary,
+                table_of_contents=toc[:DEFAULT_TOC_LIMIT],
+                scraped_at=datetime.now(timezone.utc).isoformat()
+            )
+    
+    if full_content:
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+    else:
+        # Only the tags used for the summary and TOC need to be built
+        soup = BeautifulSoup(html, parsers.HTML_PARSER, parse_only=parsers.SUMMARY_STRAINER)
+    title_tag = soup.find('h1')
+    title = title_tag.get_text(strip=True) if title_tag else slug.replace('_', ' ')
+    summary = parsers.extract_summary(soup, title_tag)
+    
+    if full_content:
+        # Extract references BEFORE modifying soup
+        references = parsers.extract_references(soup)
+        
+        # Extract metadata BEFORE modifying soup
+        fact_checked = parsers.extract_fact_check_info(soup, html)
+        
+        # NOW remove unwanted elements for clean text
+        parsers.clean_html_for_text_extraction(soup)
+        
+        # Get full text content
+        full_content_text = soup.get_text(separator='\n', strip=True)
+        
+        # Extract sections and TOC
+        sections, toc = parsers.extract_sections(soup)
+        
+        # Calculate word count
+        word_count = len(full_content_text.split())
+        
+        metadata = ArticleMetadata(
+            fact_checked=fact_checked,
+            word_count=word_count
+        )
+        
+        return Article(
+            title=title,
+            slug=slug,
+            url=url,
+            summary=summary,
+            full_content=full_content_text,
+            sections=sections,
+            table_of_contents=toc,
+            references=references,
+            metadata=metadata,
+            scraped_at=datetime.now(timezone.utc).isoformat()
+        )
+    else:
+        # Summary-only parsing
+        _, toc = parsers.extract_sections(soup)
+        
+        return ArticleSummary(
+            title=title,
+            slug=slug,
+            url=url,
+            summary=summary,
+            table_of_contents=toc[:DEFAULT_TOC_LIMIT],
+            scraped_at=datetime.now(timezone.utc).isoformat()
+        )
+
+
+_PARSE_MEMO: "OrderedDict[Tuple[bytes, str, str, bool], Union[Article, ArticleSummary]]" = OrderedDict()
+_PARSE_MEMO_LOCK = Lock()
+
+
+def _parse_memo_key(
+    html: str, slug: str, url: str, full_content: bool
+) -> Optional[Tuple[bytes, str, str, bool]]:
+    """
+    Build the parse-memo key for a page, or None if the page is too small to memoize.
+    
+    Pages are keyed by a 128-bit BLAKE2b digest, so the memo never holds on to HTML.
+    """
+    if len(html) < PARSE_MEMO_MIN_LENGTH:
+        return None
+    digest = hashlib.blake2b(html.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    return digest, slug, url, full_content
+
+
+def _parse_memo_get(key: Tuple[bytes, str, str, bool]) -> Optional[Union[Article, ArticleSummary]]:
+    """
+    Look up an earlier parse of identical HTML.
+    
+    Returns:
+        A deep copy stamped with the current time, or None on a miss
+    """
+    with _PARSE_MEMO_LOCK:
+        result = _PARSE_MEMO.get(key)
+        if result is None:
+            return None
+        _PARSE_MEMO.move_to_end(key)
+    return result.model_copy(deep=True, update={"scraped_at": datetime.now(timezone.utc).isoformat()})
+
+
+def _parse_memo_put(key: Tuple[bytes, str, str, bool], result: Union[Article, ArticleSummary]) -> None:
+    """
+    Remember a parse result, evicting the least recently used one when full.
+    
+    A deep copy is stored, so changes the caller makes to ``result`` don't leak
+    into later parses of the same page.
+    """
+    result = result.model_copy(deep=True)
+    with _PARSE_MEMO_LOCK:
+        _PARSE_MEMO[key] = result
+        _PARSE_MEMO.move_to_end(key)
+        if len(_PARSE_MEMO) > PARSE_MEMO_SIZE:
+            _PARSE_MEMO.popitem(last=False)
 
 
 class Client:
@@ -44,6 +385,17 @@ class Client:
         ...     client.close()
     """
     
+    # No per-instance __dict__; __weakref__ is needed for the close-on-collect finalizer
+    __slots__ = (
+        "_base_url", "_page_url_template", "timeout", "_verify", "_cert", "_user_agent",
+        "_headers", "_limits", "_resources", "_http_client_lock", "_finalizer", "_closed",
+        "_slug_index", "_article_cache", "_cache_validators", "max_cache_size", "_rate_limit",
+        "_rate_limit_burst", "_rate_limit_tokens", "_rate_limit_refilled_at", "_rate_limit_lock",
+        "_cache_lock", "_inflight", "_inflight_async", "_inflight_lock", "max_retries", "_backoff_base",
+        "_backoff_cap", "_transport", "_async_transport",
+        "_parse_workers", "_enable_async", "_http2", "__weakref__",
+    )
+    
     def __init__(
         self, 
         base_url: Optional[str] = None, 
@@ -54,29 +406,63 @@ class Client:
         max_retries: int = DEFAULT_MAX_RETRIES,
         verify: bool = True,
         cert: Optional[Union[str, Tuple[str, str]]] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        parse_workers: int = 0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        enable_async: bool = True,
+        http2: bool = False,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_cap: float = DEFAULT_BACKOFF_CAP,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limit_burst: int = 1
     ):
         """
         Initialize the Grokipedia SDK client.
         
         Args:
             base_url: Base URL for Grokipedia. If None, uses GROKIPEDIA_BASE_URL 
-                    environment variable or defaults to https://grokipedia.com
+                    environment variable or defaults to https://grokipedia.com.
+                    The environment variable is read once per process.
             timeout: Request timeout in seconds (default: 30.0)
             slug_index: Optional SlugIndex instance for article lookup. 
-                       If None, a default SlugIndex will be created.
+                       If None, a default SlugIndex shared by all Clients is used.
             max_cache_size: Maximum number of articles to cache (default: 1000).
                            Uses LRU eviction when limit is reached.
             rate_limit: Minimum seconds between requests (default: 1.0).
                        Set to 0 to disable rate limiting.
             max_retries: Maximum number of retry attempts for transient failures (default: 3).
-                        Set to 0 to disable retries.
+                        Connection failures are retried by the default httpx transport
+                        (not by a custom ``transport``/``async_transport``); timeouts,
+                        429 and 5xx responses by the client. Set to 0 to disable retries.
             verify: Enable SSL/TLS certificate verification (default: True).
                    Set to False to disable verification (not recommended for production).
             cert: Path to client certificate or tuple of (cert, key) paths for client cert auth.
                   (default: None)
             user_agent: Custom User-Agent string for HTTP requests. If None, uses default.
                        (default: None)
+            parse_workers: Number of worker processes used by the async methods to parse
+                          large pages in parallel (default: 0, parse in the event loop).
+            max_connections: Maximum number of concurrent connections in the pool (default: 256).
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open for reuse
+                             (default: 15.0).
+            enable_async: Allow the async methods (default: True). Set to False for
+                         synchronous-only use; the async methods then raise RuntimeError.
+            http2: Use HTTP/2 so concurrent requests share one connection (default: False).
+                  Requires the 'http2' extra; ignored if the h2 package is not installed.
+            backoff_base: Shortest delay in seconds between retries (default: 0.5).
+            backoff_cap: Longest delay in seconds between retries (default: 30.0). Retries use
+                        decorrelated jitter between these bounds; a 429 response's Retry-After
+                        header is honored up to this cap.
+            transport: Custom httpx transport for synchronous requests (default: None).
+                      Replaces the default pooled transport, e.g. httpx.MockTransport in tests.
+                      Connection failures are then not retried by the client; configure
+                      retries on the transport itself, e.g. httpx.HTTPTransport(retries=3).
+            async_transport: Custom httpx transport for async requests (default: None).
+                            As with ``transport``, connection retries are then up to it.
+            rate_limit_burst: Number of requests that may be sent back-to-back before
+                             rate_limit spacing applies (default: 1, no bursting).
                    
         Example:
             >>> # Default usage (auto-creates SlugIndex)
@@ -106,33 +492,137 @@ class Client:
         """
         # Support environment variable for base_url
         if base_url is None:
-            base_url = os.getenv("GROKIPEDIA_BASE_URL", "https://grokipedia.com")
+            base_url = _env_base_url()
         
-        self.base_url = base_url.rstrip('/')
+        self.base_url = base_url
         self.timeout = timeout
         self._verify = verify
         self._cert = cert
         self.user_agent = user_agent or DEFAULT_USER_AGENT
-        self._client = httpx.Client(
-            timeout=timeout,
-            follow_redirects=True,
-            verify=verify,
-            cert=cert
+        # Keep idle connections around long enough to skip the TCP/TLS handshake
+        # on follow-up requests; the transport owns the pool, so it gets the limits too
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(DEFAULT_MAX_KEEPALIVE_CONNECTIONS, max_connections),
+            keepalive_expiry=keepalive_expiry
         )
-        self._async_client = httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            verify=verify,
-            cert=cert
-        )
-        self._slug_index = slug_index if slug_index is not None else SlugIndex()
+        # HTTP clients are built on first use (see the _client/_async_client properties),
+        # so Clients that only search the slug index never allocate a connection pool
+        self._resources = _ClientResources()
+        self._http_client_lock = Lock()
+        # Close connections when the Client is garbage collected without close();
+        # the callback only references the resources, never the Client
+        self._finalizer = weakref.finalize(self, _finalize_resources, self._resources)
+        self._closed = False
+        self._slug_index = slug_index if slug_index is not None else _default_slug_index()
         self._article_cache: OrderedDict[str, Article] = OrderedDict()
+        # Conditional-request headers (If-None-Match/If-Modified-Since) for cached articles
+        self._cache_validators: Dict[str, Dict[str, str]] = {}
         self.max_cache_size = max_cache_size
         self._rate_limit = rate_limit
-        self._last_request_time = 0.0
+        # Token bucket on the monotonic clock: one token per rate_limit seconds, up to
+        # rate_limit_burst saved; wall-clock adjustments can't stall or release requests
+        self._rate_limit_burst = max(1, rate_limit_burst)
+        self._rate_limit_tokens = float(self._rate_limit_burst)
+        self._rate_limit_refilled_at = time.monotonic()
         self._rate_limit_lock = Lock()  # Shared lock for all rate limiting (sync and async)
         self._cache_lock = Lock()  # Shared lock for all cache operations (sync and async)
+        # Article fetches in progress, so concurrent callers for one slug share a single request.
+        # Sync and async fetches are kept apart: a blocking get_article() on an event loop's
+        # thread would otherwise wait forever on a fetch that loop can no longer run.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_async: Dict[str, Future] = {}
+        self._inflight_lock = Lock()
         self.max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_cap = backoff_cap
+        self._transport = transport
+        self._async_transport = async_transport
+        self._parse_workers = parse_workers
+        self._enable_async = enable_async
+        self._http2 = http2 and HAS_H2
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL for Grokipedia, without a trailing slash"""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # Already-clean URLs (the common case) are stored without copying
+        if value.endswith('/'):
+            value = value.rstrip('/')
+        self._base_url = value
+        # Precompute the page URL template so each request is a single %-format
+        self._page_url_template = self._base_url.replace('%', '%%') + PAGE_PATH_TEMPLATE
+    
+    @property
+    def user_agent(self) -> str:
+        """User-Agent header sent with every request"""
+        return self._user_agent
+    
+    @user_agent.setter
+    def user_agent(self, value: str) -> None:
+        self._user_agent = value
+        # Build the (read-only) request headers once instead of a new dict per request
+        if value is DEFAULT_USER_AGENT:
+            self._headers = DEFAULT_HEADERS
+        else:
+            self._headers = MappingProxyType({"User-Agent": value})
+    
+    @property
+    def _client(self) -> Optional[httpx.Client]:
+        """Synchronous httpx client, created on first access (None once closed)"""
+        client = self._resources.http_client
+        if client is None and not self._closed:
+            with self._http_client_lock:
+                if self._resources.http_client is None and not self._closed:
+                    # Connection failures are retried by the transport at the socket level,
+                    # so they never re-enter the Python retry loop or the rate limiter
+                    self._resources.http_client = httpx.Client(
+                        timeout=self.timeout,
+                        follow_redirects=True,
+                        verify=self._verify,
+                        cert=self._cert,
+                        limits=self._limits,
+                        transport=self._transport or httpx.HTTPTransport(
+                            retries=self.max_retries, verify=self._verify,
+                            cert=self._cert, limits=self._limits, http2=self._http2
+                        )
+                    )
+                client = self._resources.http_client
+        return client
+    
+    @_client.setter
+    def _client(self, value: Optional[httpx.Client]) -> None:
+        self._resources.http_client = value
+    
+    @property
+    def _async_client(self) -> Optional[httpx.AsyncClient]:
+        """Asynchronous httpx client, created on first access (None once closed)"""
+        if not self._enable_async:
+            raise RuntimeError("Async methods are disabled; create the Client with enable_async=True")
+        client = self._resources.http_async_client
+        if client is None and not self._closed:
+            with self._http_client_lock:
+                if self._resources.http_async_client is None and not self._closed:
+                    self._resources.http_async_client = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        follow_redirects=True,
+                        verify=self._verify,
+                        cert=self._cert,
+                        limits=self._limits,
+                        transport=self._async_transport or httpx.AsyncHTTPTransport(
+                            retries=self.max_retries, verify=self._verify,
+                            cert=self._cert, limits=self._limits, http2=self._http2
+                        )
+                    )
+                client = self._resources.http_async_client
+        return client
+    
+    @_async_client.setter
+    def _async_client(self, value: Optional[httpx.AsyncClient]) -> None:
+        self._resources.http_async_client = value
     
     def __enter__(self):
         """Support for context manager"""
@@ -148,28 +638,11 @@ class Client:
         
         For async contexts, prefer using aclose() instead.
         """
-        if hasattr(self, '_client') and self._client:
-            self._client.close()
-            self._client = None
-        if hasattr(self, '_async_client') and self._async_client:
-            # Run async cleanup in a way that works even from sync context
-            try:
-                # Try to get the running loop
-                loop = asyncio.get_running_loop()
-                # If we're here, a loop is running - schedule cleanup as a task
-                asyncio.create_task(self._async_client.aclose())
-            except RuntimeError:
-                # No event loop is running, run cleanup synchronously
-                try:
-                    asyncio.run(self._async_client.aclose())
-                except RuntimeError:
-                    # If asyncio.run() fails, try the legacy approach
-                    loop = asyncio.new_event_loop()
-                    try:
-                        loop.run_until_complete(self._async_client.aclose())
-                    finally:
-                        loop.close()
-            self._async_client = None
+        if self._closed:
+            return
+        self._closed = True
+        self._finalizer.detach()
+        self._resources.close()
     
     async def aclose(self):
         """
@@ -185,12 +658,11 @@ class Client:
             ...     finally:
             ...         await client.aclose()
         """
-        if hasattr(self, '_client') and self._client:
-            self._client.close()
-            self._client = None
-        if hasattr(self, '_async_client') and self._async_client:
-            await self._async_client.aclose()
-            self._async_client = None
+        if self._closed:
+            return
+        self._closed = True
+        self._finalizer.detach()
+        await self._resources.aclose()
     
     def _validate_slug(self, slug: str) -> str:
         """
@@ -205,20 +677,228 @@ class Client:
         Raises:
             ValueError: If slug is invalid or empty
         """
-        if not slug or not isinstance(slug, str):
-            raise ValueError("Slug must be a non-empty string")
+        # One type check covers None, bytes and other non-strings before stripping
+        if isinstance(slug, str):
+            slug = slug.strip()
+            if slug:
+                return _encode_slug(slug)
+        
+        raise ValueError("Slug must be a non-empty string")
+    
+    def validate_slugs(self, slugs: Iterable[str]) -> List[str]:
+        """
+        Validate and URL-encode a batch of slugs.
+        
+        Useful for checking a list of slugs up front before fetching them. Repeated
+        slugs are served from the shared encoding cache.
+        
+        Args:
+            slugs: Slugs to validate
+            
+        Returns:
+            Validated and URL-encoded slugs, in the same order as ``slugs``
+            
+        Raises:
+            ValueError: If any slug is invalid or empty
+            
+        Example:
+            >>> client = Client()
+            >>> client.validate_slugs(["Joe_Biden", "AC/DC"])
+            ['Joe_Biden', 'AC%2FDC']
+        """
+        return list(map(self._validate_slug, slugs))
+    
+    def _get_cached_article(self, slug: str) -> Optional[Article]:
+        """
+        Look up an article in the LRU cache and mark it as most recently used.
+        
+        Thread-safe; the threading lock is also used from async code since
+        OrderedDict operations are fast and won't block the event loop.
+        
+        Args:
+            slug: Validated article slug
+            
+        Returns:
+            Cached Article, or None on a cache miss
+        """
+        with self._cache_lock:
+            # One lookup for the hit, then a single C-level reorder
+            article = self._article_cache.get(slug)
+            if article is not None:
+                self._article_cache.move_to_end(slug)
+            return article
+    
+    def _cache_article(
+        self,
+        slug: str,
+        article: Article,
+        response: Optional[httpx.Response] = None,
+        replace: bool = False
+    ) -> None:
+        """
+        Store an article in the LRU cache, evicting the oldest entry when full.
+        
+        Args:
+            slug: Validated article slug
+            article: Parsed article to cache
+            response: Response the article was parsed from; its ETag/Last-Modified
+                      headers are kept for revalidating the entry later
+            replace: Overwrite an existing entry (used when refreshing)
+        """
+        validators = self._conditional_headers(response) if response is not None else None
+        with self._cache_lock:
+            if slug in self._article_cache:
+                self._article_cache.move_to_end(slug)
+                if not replace:
+                    # Another thread/task cached it while we were fetching
+                    return
+            elif len(self._article_cache) >= self.max_cache_size:
+                if not self._article_cache:
+                    return  # max_cache_size <= 0 disables caching
+                evicted, _ = self._article_cache.popitem(last=False)  # Remove oldest entry
+                self._cache_validators.pop(evicted, None)
+            # New keys are inserted at the end, i.e. as most recently used
+            self._article_cache[slug] = article
+            if validators:
+                self._cache_validators[slug] = validators
+            else:
+                self._cache_validators.pop(slug, None)
+    
+    def _claim_inflight(self, slug: str, inflight: Dict[str, Future]) -> Tuple[Future, bool]:
+        """
+        Join the in-progress fetch for a slug, or register a new one.
+        
+        Args:
+            slug: Validated article slug
+            inflight: In-progress fetches for the caller's path (_inflight or _inflight_async)
+            
+        Returns:
+            Tuple of (future for the article, True if the caller must do the fetch)
+        """
+        with self._inflight_lock:
+            future = inflight.get(slug)
+            if future is not None:
+                return future, False
+            future = inflight[slug] = Future()
+            return future, True
+    
+    def _release_inflight(
+        self,
+        slug: str,
+        inflight: Dict[str, Future],
+        future: Future,
+        article: Optional[Article] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Unregister a finished fetch and hand its outcome to any waiting callers.
+        
+        Args:
+            slug: Validated article slug
+            inflight: Map the future was claimed from
+            future: Future returned by _claim_inflight()
+            article: Fetched article on success
+            error: Exception raised by the fetch on failure; cancellation and
+                   interrupts are not passed on, waiters retry the fetch instead
+        """
+        with self._inflight_lock:
+            inflight.pop(slug, None)
+        if isinstance(error, _FETCH_ABORTS):
+            future.set_exception(_FetchAbandoned())
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(article)
+    
+    @staticmethod
+    def _conditional_headers(response: httpx.Response) -> Optional[Dict[str, str]]:
+        """
+        Build conditional-request headers from a response's cache validators.
+        
+        Args:
+            response: Successful article response
+            
+        Returns:
+            If-None-Match/If-Modified-Since headers, or None if the response had no validators
+        """
+        headers = {}
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str):
+            headers["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if isinstance(last_modified, str):
+            headers["If-Modified-Since"] = last_modified
+        return headers or None
+    
+    @staticmethod
+    def _summary_from_article(article: Article) -> ArticleSummary:
+        """
+        Project a cached Article onto an ArticleSummary without re-fetching.
+        
+        Args:
+            article: Fully parsed article
+            
+        Returns:
+            ArticleSummary built from the article's fields
+        """
+        return ArticleSummary(
+            title=article.title,
+            slug=article.slug,
+            url=article.url,
+            summary=article.summary,
+            table_of_contents=article.table_of_contents[:DEFAULT_TOC_LIMIT],
+            scraped_at=article.scraped_at
+        )
+    
+    def _reserve_request_slot(self) -> float:
+        """
+        Take a token from the rate-limit bucket.
         
-        # Strip whitespace
-        slug = slug.strip()
+        When the bucket is empty the token is borrowed against future refills, so
+        concurrent callers queue up one rate_limit interval apart.
         
-        if not slug:
-            raise ValueError("Slug cannot be empty")
+        Returns:
+            Seconds the caller must wait before sending its request (0 if a token was free)
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            refilled = (now - self._rate_limit_refilled_at) / self._rate_limit
+            self._rate_limit_tokens = min(self._rate_limit_burst, self._rate_limit_tokens + refilled) - 1
+            self._rate_limit_refilled_at = now
+            if self._rate_limit_tokens >= 0:
+                return 0.0
+            return -self._rate_limit_tokens * self._rate_limit
+    
+    def _next_backoff(self, previous: float) -> float:
+        """
+        Pick the next retry delay using decorrelated jitter.
         
-        # URL encode to prevent injection and handle special characters safely
-        # Allow underscores and hyphens to pass through as-is (common in slugs)
-        encoded_slug = quote(slug, safe='_-')
+        Delays grow roughly exponentially but are randomized, so clients that
+        failed together don't retry in lockstep.
         
-        return encoded_slug
+        Args:
+            previous: The previous delay (backoff_base before the first retry)
+            
+        Returns:
+            Delay in seconds between backoff_base and backoff_cap
+        """
+        return min(self._backoff_cap, random.uniform(self._backoff_base, previous * 3))
+    
+    def _rate_limited_backoff(self, response: httpx.Response, previous: float) -> float:
+        """
+        Pick the retry delay after a 429, preferring the server's Retry-After header.
+        
+        Args:
+            response: The 429 response
+            previous: The previous delay
+            
+        Returns:
+            Delay in seconds, at most backoff_cap
+        """
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self._next_backoff(previous)
+        return min(self._backoff_cap, retry_after)
     
     def _fetch_html(self, url: str, slug: Optional[str] = None) -> str:
         """
@@ -231,74 +911,94 @@ class Client:
         Returns:
             HTML content as string
             
+        Raises:
+            ArticleNotFound: If the article is not found (404)
+            RequestError: For other HTTP errors or network issues
+        """
+        return self._fetch(url, slug=slug).text
+    
+    def _fetch(
+        self, url: str, slug: Optional[str] = None, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Fetch a URL with error handling, rate limiting, and retry logic.
+        
+        Args:
+            url: URL to fetch
+            slug: Optional article slug for better error messages
+            headers: Extra request headers, e.g. conditional-request validators
+            
+        Returns:
+            The successful response, or a 304 response to a conditional request
+            
         Raises:
             ArticleNotFound: If the article is not found (404)
             RequestError: For other HTTP errors or network issues
         """
         last_exception = None
+        delay = self._backoff_base
         
         for attempt in range(self.max_retries + 1):
-            # Rate limiting
+            # Rate limiting (the wait happens outside the lock)
             if self._rate_limit > 0:
-                with self._rate_limit_lock:
-                    elapsed = time.time() - self._last_request_time
-                    if elapsed < self._rate_limit:
-                        time.sleep(self._rate_limit - elapsed)
-                    self._last_request_time = time.time()
+                wait = self._reserve_request_slot()
+                if wait > 0:
+                    time.sleep(wait)
             
             try:
-                headers = {
-                    "User-Agent": self.user_agent
-                }
-                response = self._client.get(url, headers=headers)
+                # Conditional requests add validators; plain fetches share the prebuilt headers
+                request_headers = {**self._headers, **headers} if headers else self._headers
+                response = self._client.get(url, headers=request_headers)
+                if response.status_code == 304:
+                    # Only a conditional request can be answered with Not Modified
+                    if headers:
+                        return response
+                    raise RequestError(f"Unexpected 304 Not Modified fetching {url} without validators")
                 response.raise_for_status()
-                return response.text
-            except httpx.ConnectError as e:
-                # Connection errors - retryable
-                last_exception = RequestError(f"Failed to connect to {self.base_url}: {str(e)}")
-                if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                raise last_exception
+                return response
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Connection errors - already retried by the transport
+                raise RequestError(f"Failed to connect to {self.base_url}: {str(e)}")
             except httpx.TimeoutException as e:
                 # Timeout errors - retryable
                 last_exception = RequestError(f"Request timeout after {self.timeout}s: {str(e)}")
                 if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    delay = self._next_backoff(delay)
+                    time.sleep(delay)
                     continue
                 raise last_exception
             except httpx.HTTPStatusError as e:
-                # HTTP status errors
+                # HTTP status errors, classified with one table lookup
                 status_code = e.response.status_code
-                if status_code == 404:
+                action = _STATUS_ACTIONS.get(status_code, _STATUS_FAIL)
+                if action == _STATUS_NOT_FOUND:
                     slug_display = slug if slug else 'unknown'
                     raise ArticleNotFound(
                         f"Article '{slug_display}' not found at {url}. "
                         f"Status: {status_code}"
                     )
-                elif status_code == 429:
-                    # Rate limited - retryable
+                if action == _STATUS_FAIL:
+                    # Client errors (4xx except 404, 408, 429) - not retryable
+                    raise RequestError(f"HTTP error {status_code} fetching {url}: {str(e)}")
+                if action == _STATUS_RATE_LIMITED:
+                    # Rate limited - retryable, honoring Retry-After
                     last_exception = RequestError(f"Rate limited by server. Please retry after delay.")
-                    if attempt < self.max_retries:
-                        # Longer delay for rate limiting
-                        time.sleep(2 ** (attempt + 2))
-                        continue
-                    raise last_exception
-                elif status_code >= 500:
-                    # Server errors - retryable
-                    last_exception = RequestError(f"Server error {status_code} fetching {url}: {str(e)}")
-                    if attempt < self.max_retries:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    raise last_exception
+                    delay = self._rate_limited_backoff(e.response, delay)
                 else:
-                    # Client errors (4xx except 404, 429) - not retryable
-                    raise RequestError(f"HTTP error {status_code} fetching {url}: {str(e)}")
+                    # Server errors and 408 Request Timeout - retryable
+                    kind = "Server error" if status_code >= 500 else "HTTP error"
+                    last_exception = RequestError(f"{kind} {status_code} fetching {url}: {str(e)}")
+                    delay = self._next_backoff(delay)
+                if attempt < self.max_retries:
+                    time.sleep(delay)
+                    continue
+                raise last_exception
             except httpx.RequestError as e:
                 # Other request errors - retryable
                 last_exception = RequestError(f"Request failed: {str(e)}")
                 if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    delay = self._next_backoff(delay)
+                    time.sleep(delay)
                     continue
                 raise last_exception
             except Exception as e:
@@ -328,69 +1028,58 @@ class Client:
         Returns:
             Article object if full_content=True, ArticleSummary otherwise
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        title_tag = soup.find('h1')
-        title = title_tag.get_text(strip=True) if title_tag else slug.replace('_', ' ')
-        summary = parsers.extract_summary(soup, title_tag)
+        # Unchanged pages (e.g. a refresh without ETag support) skip the parse
+        key = _parse_memo_key(html, slug, url, full_content)
+        if key is not None:
+            result = _parse_memo_get(key)
+            if result is not None:
+                return result
+        result = _parse_article_html(html, slug, url, full_content)
+        if key is not None:
+            _parse_memo_put(key, result)
+        return result
+    
+    async def _parse_article_html_async(
+        self, html: str, slug: str, url: str, full_content: bool = True
+    ) -> Union[Article, ArticleSummary]:
+        """
+        Async version of _parse_article_html().
         
-        if full_content:
-            # Extract references BEFORE modifying soup
-            references = parsers.extract_references(soup)
-            
-            # Extract metadata BEFORE modifying soup
-            fact_checked = parsers.extract_fact_check_info(soup)
-            
-            # NOW remove unwanted elements for clean text
-            parsers.clean_html_for_text_extraction(soup)
-            
-            # Get full text content
-            full_content_text = soup.get_text(separator='\n', strip=True)
-            
-            # Extract sections and TOC
-            sections, toc = parsers.extract_sections(soup)
-            
-            # Calculate word count
-            word_count = len(full_content_text.split())
-            
-            metadata = ArticleMetadata(
-                fact_checked=fact_checked,
-                word_count=word_count
-            )
-            
-            return Article(
-                title=title,
-                slug=slug,
-                url=url,
-                summary=summary,
-                full_content=full_content_text,
-                sections=sections,
-                table_of_contents=toc,
-                references=references,
-                metadata=metadata,
-                scraped_at=datetime.now(timezone.utc).isoformat()
+        When parse_workers is enabled, large pages are parsed in a worker process
+        so that concurrent requests are not serialized on the GIL. Small pages are
+        parsed inline because the inter-process overhead would dominate.
+        """
+        key = _parse_memo_key(html, slug, url, full_content)
+        if key is not None:
+            result = _parse_memo_get(key)
+            if result is not None:
+                return result
+        if self._parse_workers > 0 and len(html) >= PARSE_OFFLOAD_THRESHOLD:
+            if self._resources.parse_executor is None:
+                self._resources.parse_executor = ProcessPoolExecutor(max_workers=self._parse_workers)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._resources.parse_executor, _parse_article_html, html, slug, url, full_content
             )
         else:
-            # Summary-only parsing
-            _, toc = parsers.extract_sections(soup)
-            
-            return ArticleSummary(
-                title=title,
-                slug=slug,
-                url=url,
-                summary=summary,
-                table_of_contents=toc[:DEFAULT_TOC_LIMIT],
-                scraped_at=datetime.now(timezone.utc).isoformat()
-            )
+            result = _parse_article_html(html, slug, url, full_content)
+        if key is not None:
+            _parse_memo_put(key, result)
+        return result
     
-    def get_article(self, slug: str) -> Article:
+    def get_article(self, slug: str, refresh: bool = False) -> Article:
         """
         Get a complete article from Grokipedia by slug.
         
         Articles are automatically cached after the first fetch to improve
         performance for subsequent requests. Cache uses LRU eviction policy.
+        Concurrent calls for the same slug share a single request.
         
         Args:
             slug: Article slug (e.g., "Joe_Biden")
+            refresh: Revalidate a cached article with the server (default: False).
+                    Sends If-None-Match/If-Modified-Since when the page had an ETag or
+                    Last-Modified header; a 304 reply keeps the cached article without re-parsing.
             
         Returns:
             Article object with full content
@@ -412,31 +1101,102 @@ class Client:
         slug = self._validate_slug(slug)
         
         # Check cache first (with LRU ordering) - thread-safe
-        with self._cache_lock:
-            if slug in self._article_cache:
-                self._article_cache.move_to_end(slug)
-                return self._article_cache[slug]
+        cached = self._get_cached_article(slug)
+        if cached is not None and not refresh:
+            return cached
         
-        # Not in cache, fetch from network
-        url = f"{self.base_url}/page/{slug}"
-        html = self._fetch_html(url, slug=slug)
-        article = self._parse_article_html(html, slug, url, full_content=True)
+        # Concurrent callers for the same slug wait for a single fetch; if that
+        # fetch's caller is cancelled or interrupted, claim the slug again
+        while True:
+            future, leader = self._claim_inflight(slug, self._inflight)
+            if leader:
+                break
+            try:
+                return future.result()
+            except _FetchAbandoned:
+                continue
         
-        # Cache the article for future use (with LRU eviction) - thread-safe with double-check
-        with self._cache_lock:
-            # Double-check pattern: another thread might have cached it while we were fetching
-            if slug not in self._article_cache:
-                if len(self._article_cache) >= self.max_cache_size:
-                    self._article_cache.popitem(last=False)  # Remove oldest entry
-                self._article_cache[slug] = article
-            self._article_cache.move_to_end(slug)  # Mark as most recently used
+        try:
+            # Not in cache (or revalidating), fetch from network
+            url = self._page_url_template % slug
+            validators = self._cache_validators.get(slug) if cached is not None else None
+            response = self._fetch(url, slug=slug, headers=validators)
+            if validators and cached is not None and response.status_code == 304:
+                article = cached
+            else:
+                article = self._parse_article_html(response.text, slug, url, full_content=True)
+                # Cache the article for future use (with LRU eviction)
+                self._cache_article(slug, article, response, replace=refresh)
+        except BaseException as e:
+            self._release_inflight(slug, self._inflight, future, error=e)
+            raise
         
+        self._release_inflight(slug, self._inflight, future, article=article)
         return article
     
+    def get_articles(
+        self,
+        slugs: List[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False
+    ) -> List[Union[Article, BaseException]]:
+        """
+        Fetch multiple articles concurrently from synchronous code.
+        
+        Requests run on a thread pool sharing the client's connection pool, with at
+        most ``max_concurrency`` in flight; the client's rate limit still applies
+        across all of them. From async code, use get_articles_async() instead.
+        
+        Args:
+            slugs: Article slugs to fetch
+            max_concurrency: Maximum number of simultaneous requests (default: 32)
+            return_exceptions: If True, failed fetches are returned in place of their
+                              article instead of raising
+            
+        Returns:
+            List of Article objects in the same order as ``slugs``
+            
+        Raises:
+            ValueError: If a slug is invalid or max_concurrency < 1
+            ArticleNotFound: If an article doesn't exist
+            RequestError: For network or HTTP errors
+            
+        Example:
+            >>> client = Client()
+            >>> articles = client.get_articles(["Joe_Biden", "Barack_Obama"])
+            >>> [article.title for article in articles]
+            ['Joe Biden', 'Barack Obama']
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not slugs:
+            return []
+        
+        def fetch(slug: str) -> Union[Article, BaseException]:
+            try:
+                return self.get_article(slug)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(slugs))) as pool:
+            futures = [pool.submit(fetch, slug) for slug in slugs]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # Don't start requests that haven't begun yet
+                for future in futures:
+                    future.cancel()
+                raise
+    
     def get_summary(self, slug: str) -> ArticleSummary:
         """
         Get just the summary/intro of an article (faster, less data).
         
+        If the full article is already cached, the summary is built from it
+        without a network request.
+        
         Args:
             slug: Article slug (e.g., "Joe_Biden")
             
@@ -458,7 +1218,12 @@ class Client:
         """
         # Validate and sanitize slug
         slug = self._validate_slug(slug)
-        url = f"{self.base_url}/page/{slug}"
+        
+        cached = self._get_cached_article(slug)
+        if cached is not None:
+            return self._summary_from_article(cached)
+        
+        url = self._page_url_template % slug
         html = self._fetch_html(url, slug=slug)
         return self._parse_article_html(html, slug, url, full_content=False)
     
@@ -466,6 +1231,9 @@ class Client:
         """
         Get a specific section of an article by title.
         
+        An exact (case-insensitive) title match is preferred; otherwise the
+        first section whose title contains section_title is returned.
+        
         Args:
             slug: Article slug (e.g., "Joe_Biden")
             section_title: Section title to search for
@@ -490,14 +1258,8 @@ class Client:
         # Validation happens in get_article
         article = self.get_article(slug)
         
-        # Find matching section (case-insensitive, partial match)
-        section_title_lower = section_title.lower().replace('_', ' ')
-        
-        for section in article.sections:
-            if section_title_lower in section.title.lower():
-                return section
-        
-        return None
+        # Exact title match first, then case-insensitive partial match
+        return article.find_section(section_title)
     
     # Slug search and discovery methods
     
@@ -638,78 +1400,95 @@ class Client:
         Raises:
             ArticleNotFound: If the article is not found (404)
             RequestError: For other HTTP errors or network issues
+            RuntimeError: If the Client was created with enable_async=False
+        """
+        return (await self._fetch_async(url, slug=slug)).text
+    
+    async def _fetch_async(
+        self, url: str, slug: Optional[str] = None, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Async version of _fetch for concurrent operations.
+        
+        Args:
+            url: URL to fetch
+            slug: Optional article slug for better error messages
+            headers: Extra request headers, e.g. conditional-request validators
+            
+        Returns:
+            The successful response, or a 304 response to a conditional request
+            
+        Raises:
+            ArticleNotFound: If the article is not found (404)
+            RequestError: For other HTTP errors or network issues
+            RuntimeError: If the Client was created with enable_async=False
         """
+        async_client = self._async_client  # Raises RuntimeError if async is disabled
         last_exception = None
+        delay = self._backoff_base
         
         for attempt in range(self.max_retries + 1):
-            # Rate limiting with shared lock to prevent race conditions
-            # Use threading lock directly since time operations are fast (won't block event loop)
+            # Rate limiting; reserving a slot only holds a threading lock briefly,
+            # so it won't block the event loop, and concurrent coroutines are spaced out
             if self._rate_limit > 0:
-                sleep_time = 0.0
-                with self._rate_limit_lock:
-                    elapsed = time.time() - self._last_request_time
-                    if elapsed < self._rate_limit:
-                        sleep_time = self._rate_limit - elapsed
-                # Release lock before sleeping to avoid blocking other requests
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                # Update timestamp after sleep
-                with self._rate_limit_lock:
-                    self._last_request_time = time.time()
+                wait = self._reserve_request_slot()
+                if wait > 0:
+                    await asyncio.sleep(wait)
             
             try:
-                headers = {
-                    "User-Agent": self.user_agent
-                }
-                response = await self._async_client.get(url, headers=headers)
+                # Conditional requests add validators; plain fetches share the prebuilt headers
+                request_headers = {**self._headers, **headers} if headers else self._headers
+                response = await async_client.get(url, headers=request_headers)
+                if response.status_code == 304:
+                    # Only a conditional request can be answered with Not Modified
+                    if headers:
+                        return response
+                    raise RequestError(f"Unexpected 304 Not Modified fetching {url} without validators")
                 response.raise_for_status()
-                return response.text
-            except httpx.ConnectError as e:
-                # Connection errors - retryable
-                last_exception = RequestError(f"Failed to connect to {self.base_url}: {str(e)}")
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                raise last_exception
+                return response
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Connection errors - already retried by the transport
+                raise RequestError(f"Failed to connect to {self.base_url}: {str(e)}")
             except httpx.TimeoutException as e:
                 # Timeout errors - retryable
                 last_exception = RequestError(f"Request timeout after {self.timeout}s: {str(e)}")
                 if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    delay = self._next_backoff(delay)
+                    await asyncio.sleep(delay)
                     continue
                 raise last_exception
             except httpx.HTTPStatusError as e:
-                # HTTP status errors
+                # HTTP status errors, classified with one table lookup
                 status_code = e.response.status_code
-                if status_code == 404:
+                action = _STATUS_ACTIONS.get(status_code, _STATUS_FAIL)
+                if action == _STATUS_NOT_FOUND:
                     slug_display = slug if slug else 'unknown'
                     raise ArticleNotFound(
                         f"Article '{slug_display}' not found at {url}. "
                         f"Status: {status_code}"
                     )
-                elif status_code == 429:
-                    # Rate limited - retryable
+                if action == _STATUS_FAIL:
+                    # Client errors (4xx except 404, 408, 429) - not retryable
+                    raise RequestError(f"HTTP error {status_code} fetching {url}: {str(e)}")
+                if action == _STATUS_RATE_LIMITED:
+                    # Rate limited - retryable, honoring Retry-After
                     last_exception = RequestError(f"Rate limited by server. Please retry after delay.")
-                    if attempt < self.max_retries:
-                        # Longer delay for rate limiting
-                        await asyncio.sleep(2 ** (attempt + 2))
-                        continue
-                    raise last_exception
-                elif status_code >= 500:
-                    # Server errors - retryable
-                    last_exception = RequestError(f"Server error {status_code} fetching {url}: {str(e)}")
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    raise last_exception
+                    delay = self._rate_limited_backoff(e.response, delay)
                 else:
-                    # Client errors (4xx except 404, 429) - not retryable
-                    raise RequestError(f"HTTP error {status_code} fetching {url}: {str(e)}")
+                    # Server errors and 408 Request Timeout - retryable
+                    kind = "Server error" if status_code >= 500 else "HTTP error"
+                    last_exception = RequestError(f"{kind} {status_code} fetching {url}: {str(e)}")
+                    delay = self._next_backoff(delay)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(delay)
+                    continue
+                raise last_exception
             except httpx.RequestError as e:
                 # Other request errors - retryable
                 last_exception = RequestError(f"Request failed: {str(e)}")
                 if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    delay = self._next_backoff(delay)
+                    await asyncio.sleep(delay)
                     continue
                 raise last_exception
             except Exception as e:
@@ -721,7 +1500,7 @@ class Client:
             raise last_exception
         raise RequestError(f"Failed to fetch {url} after {self.max_retries + 1} attempts")
     
-    async def get_article_async(self, slug: str) -> Article:
+    async def get_article_async(self, slug: str, refresh: bool = False) -> Article:
         """
         Async version of get_article() for concurrent operations.
         
@@ -730,6 +1509,8 @@ class Client:
         
         Args:
             slug: Article slug (e.g., "Joe_Biden")
+            refresh: Revalidate a cached article with the server (default: False).
+                    A 304 reply keeps the cached article without re-parsing.
             
         Returns:
             Article object with full content
@@ -754,26 +1535,38 @@ class Client:
         slug = self._validate_slug(slug)
         
         # Check cache first (with LRU ordering) - thread-safe
-        # Use threading lock directly since OrderedDict ops are fast (won't block event loop)
-        with self._cache_lock:
-            if slug in self._article_cache:
-                self._article_cache.move_to_end(slug)
-                return self._article_cache[slug]
+        cached = self._get_cached_article(slug)
+        if cached is not None and not refresh:
+            return cached
         
-        # Not in cache, fetch from network
-        url = f"{self.base_url}/page/{slug}"
-        html = await self._fetch_html_async(url, slug=slug)
-        article = self._parse_article_html(html, slug, url, full_content=True)
+        # Concurrent callers for the same slug wait for a single fetch; shield the
+        # shared future so cancelling one waiter doesn't cancel it for the others,
+        # and claim the slug again if the fetching caller itself is cancelled
+        while True:
+            future, leader = self._claim_inflight(slug, self._inflight_async)
+            if leader:
+                break
+            try:
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _FetchAbandoned:
+                continue
         
-        # Cache the article for future use (with LRU eviction) - thread-safe with double-check
-        with self._cache_lock:
-            # Double-check pattern: another thread/task might have cached it while we were fetching
-            if slug not in self._article_cache:
-                if len(self._article_cache) >= self.max_cache_size:
-                    self._article_cache.popitem(last=False)  # Remove oldest entry
-                self._article_cache[slug] = article
-            self._article_cache.move_to_end(slug)  # Mark as most recently used
+        try:
+            # Not in cache (or revalidating), fetch from network
+            url = self._page_url_template % slug
+            validators = self._cache_validators.get(slug) if cached is not None else None
+            response = await self._fetch_async(url, slug=slug, headers=validators)
+            if validators and cached is not None and response.status_code == 304:
+                article = cached
+            else:
+                article = await self._parse_article_html_async(response.text, slug, url, full_content=True)
+                # Cache the article for future use (with LRU eviction)
+                self._cache_article(slug, article, response, replace=refresh)
+        except BaseException as e:
+            self._release_inflight(slug, self._inflight_async, future, error=e)
+            raise
         
+        self._release_inflight(slug, self._inflight_async, future, article=article)
         return article
     
     async def get_summary_async(self, slug: str) -> ArticleSummary:
@@ -807,7 +1600,59 @@ class Client:
         """
         # Validate and sanitize slug
         slug = self._validate_slug(slug)
-        url = f"{self.base_url}/page/{slug}"
+        
+        cached = self._get_cached_article(slug)
+        if cached is not None:
+            return self._summary_from_article(cached)
+        
+        url = self._page_url_template % slug
         html = await self._fetch_html_async(url, slug=slug)
-        return self._parse_article_html(html, slug, url, full_content=False)
-
+        return await self._parse_article_html_async(html, slug, url, full_content=False)
+    
+    async def get_articles_async(
+        self,
+        slugs: List[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False
+    ) -> List[Union[Article, BaseException]]:
+        """
+        Fetch multiple articles concurrently.
+        
+        Preferred over a raw ``asyncio.gather`` over get_article_async() for large
+        batches: at most ``max_concurrency`` requests are in flight at once, while
+        the client's rate limit keeps a global pace across all of them.
+        
+        Args:
+            slugs: Article slugs to fetch
+            max_concurrency: Maximum number of simultaneous requests (default: 32)
+            return_exceptions: If True, failed fetches are returned in place of their
+                              article instead of raising (same as asyncio.gather)
+            
+        Returns:
+            List of Article objects in the same order as ``slugs``
+            
+        Raises:
+            ValueError: If a slug is invalid or max_concurrency < 1
+            ArticleNotFound: If an article doesn't exist
+            RequestError: For network or HTTP errors
+            
+        Example:
+            >>> import asyncio
+            >>> async def fetch_batch():
+            ...     client = Client()
+            ...     return await client.get_articles_async(["Joe_Biden", "Barack_Obama"])
+            >>> articles = asyncio.run(fetch_batch())
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(slug: str) -> Article:
+            async with semaphore:
+                return await self.get_article_async(slug)
+        
+        return await asyncio.gather(
+            *(fetch(slug) for slug in slugs),
+            return_exceptions=return_exceptions
+        )
@@ -1,7 +1,7 @@
 """Pydantic models for the Grokipedia SDK"""
 
-from pydantic import BaseModel, Field, field_validator, HttpUrl
-from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator, HttpUrl, PrivateAttr
+from typing import Dict, List, Optional
 
 
 class Section(BaseModel):
@@ -47,6 +47,40 @@ class Article(BaseModel):
     metadata: ArticleMetadata = Field(..., description="Article metadata")
     scraped_at: str = Field(..., description="ISO timestamp when article was scraped")
     
+    # Lowercased section title -> first section with that title, built on first lookup
+    _sections_by_title: Optional[Dict[str, Section]] = PrivateAttr(default=None)
+    
+    def find_section(self, section_title: str) -> Optional[Section]:
+        """
+        Find a section by title (case-insensitive).
+        
+        An exact title match is looked up in an index built on first use;
+        otherwise the first section whose title contains section_title is returned.
+        
+        Args:
+            section_title: Section title to search for (underscores are treated as spaces)
+            
+        Returns:
+            Matching Section, or None if no section matches
+        """
+        query = section_title.lower().replace('_', ' ')
+        
+        if self._sections_by_title is None:
+            index: Dict[str, Section] = {}
+            for section in self.sections:
+                index.setdefault(section.title.lower(), section)
+            self._sections_by_title = index
+        
+        section = self._sections_by_title.get(query)
+        if section is not None:
+            return section
+        
+        for section in self.sections:
+            if query in section.title.lower():
+                return section
+        
+        return None
+    
     def __repr__(self) -> str:
         title_preview = self.title[:50] + "..." if len(self.title) > 50 else self.title
         return f"<Article title='{title_preview}' slug='{self.slug}' sections={len(self.sections)} word_count={self.metadata.word_count}>"
@@ -1,14 +1,26 @@
 """HTML parsing and extraction logic for Grokipedia articles"""
 
+import html
 import re
 from typing import Tuple, List, Optional
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from .models import Section
 
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# BeautifulSoup tree builder: libxml2 when available, pure-Python fallback otherwise
+HTML_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
 # Summary extraction constants
 MIN_SUMMARY_LENGTH = 200  # Minimum characters for a substantial summary paragraph
 MIN_FALLBACK_SUMMARY_LENGTH = 50  # Minimum characters for fallback summary
+SUMMARY_SKIP_PREFIXES = ('Jump to', 'From ')  # Navigation text that isn't the intro paragraph
 
 # HTML Element Selectors (constants to replace magic strings)
 HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
@@ -18,14 +30,66 @@ SECTION_TAGS = ['ol', 'ul']
 TEXT_CONTAINER_TAGS = ['p', 'div']
 SCRIPT_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'button']
 
+# Section heading tag -> level; h1 is the article title, not a section
+SECTION_HEADING_LEVELS = {'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+
+# Tags needed to build a summary; everything else is skipped at parse time
+SUMMARY_STRAINER = SoupStrainer(['meta', 'article', 'main'] + HEADING_TAGS + TEXT_CONTAINER_TAGS)
+
+# Tags extract_references() reads: headings, link containers and the links themselves
+REFERENCES_STRAINER = SoupStrainer(['a'] + HEADING_TAGS + SECTION_TAGS + TEXT_CONTAINER_TAGS)
+
+# Only the meta tags, for reading the page description without building the body
+META_STRAINER = SoupStrainer('meta')
+
 # Meta tag properties
 OG_DESCRIPTION_META = {'property': 'og:description'}
 DESCRIPTION_META = {'name': 'description'}
 
 # Regex patterns
-REFERENCES_HEADING_PATTERN = re.compile(r'^References?$', re.IGNORECASE)
+REFERENCES_HEADING_PATTERN = re.compile(r'^\s*References?\s*$', re.IGNORECASE)
+REFERENCES_IDS = ['references', 'References']
+# http(s) link that doesn't point back at Grokipedia, for the references fallback
+EXTERNAL_LINK_PATTERN = re.compile(r'http(?!.*grokipedia\.com)', re.DOTALL)
 FACT_CHECK_PATTERN = re.compile(r'Fact-checked by', re.IGNORECASE)
 FACT_CHECK_EXTRACT_PATTERN = re.compile(r'Fact-checked by\s+(.+?)(?:\s*(?:\n|$))', re.IGNORECASE)
+FACT_CHECK_META_PATTERN = re.compile(r'Fact-checked by (.+?)(?:\.|$)')
+# Markup that isn't a text node: comments, raw-text elements with their content, and
+# tags, whose quoted attribute values may contain '>'. Text nodes lie between matches.
+# Unquoted tag text stops at '<', so an unclosed tag can't make the scan quadratic.
+MARKUP_TOKEN_PATTERN = re.compile(
+    r'<(?:!--.*?(?:-->|\Z)'
+    r'|(script|style|textarea|title|xmp|iframe|noembed|noframes)\b(?:[^<>"\']|"[^"]*"|\'[^\']*\')*>'
+    r'.*?(?:</\1\s*>|\Z)'
+    r'|[A-Za-z/!?](?:[^<>"\']|"[^"]*"|\'[^\']*\')*>)',
+    re.IGNORECASE | re.DOTALL
+)
+# Left in a text node by markup MARKUP_TOKEN_PATTERN couldn't close
+STRAY_MARKUP_PATTERN = re.compile(r'<[A-Za-z/!?]')
+
+# Fast-path patterns for summary extraction without building a tree
+RAW_TEXT_PATTERN = re.compile(r'<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+META_TAG_PATTERN = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+TAG_ATTRIBUTE_PATTERN = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+))')
+HEADING_PATTERN = re.compile(r'<h([1-6])\b[^>]*>(.*?)</h\1\s*>', re.IGNORECASE | re.DOTALL)
+MARKUP_PATTERN = re.compile(r'<[^>]*>')
+
+if HAS_LXML:
+    # Compiled XPath queries for summary extraction straight from an lxml tree.
+    # Text nodes inside these tags are skipped, as BeautifulSoup's get_text() does.
+    _TEXT_XPATH = etree.XPath(
+        './/text()[not(ancestor::script or ancestor::style or ancestor::template'
+        ' or ancestor::rp or ancestor::rt)]',
+        smart_strings=False
+    )
+    _OG_DESCRIPTION_XPATH = etree.XPath('(//meta[@property="og:description"])[1]')
+    _DESCRIPTION_XPATH = etree.XPath('(//meta[@name="description"])[1]')
+    _TITLE_XPATH = etree.XPath('(//h1)[1]')
+    _ARTICLE_XPATH = etree.XPath('(//article)[1]')
+    _MAIN_XPATH = etree.XPath('(//main)[1]')
+    _TITLE_SIBLINGS_XPATH = etree.XPath('following-sibling::*[self::p or self::div]')
+    _PARAGRAPHS_XPATH = etree.XPath('descendant-or-self::p')
+    _SUBHEADINGS_XPATH = etree.XPath('//h2 | //h3 | //h4 | //h5 | //h6')
 
 
 def extract_sections(soup: BeautifulSoup) -> Tuple[List[Section], List[str]]:
@@ -41,30 +105,27 @@ def extract_sections(soup: BeautifulSoup) -> Tuple[List[Section], List[str]]:
     sections = []
     toc = []
     
-    # Find all heading tags
-    headings = soup.find_all(HEADING_TAGS)
+    # Find all section headings
+    headings = soup.find_all(list(SECTION_HEADING_LEVELS))
     
     for heading in headings:
-        level = int(heading.name[1])  # Extract number from h1, h2, etc.
+        level = SECTION_HEADING_LEVELS[heading.name]
         title = heading.get_text(strip=True)
-        
-        # Skip the main article title (usually h1)
-        if level == 1:
-            continue
-            
         toc.append(title)
         
-        # Get content after heading until next heading
+        # Get content after heading until next heading. next_siblings is lazy,
+        # so only the siblings up to the next heading are visited
         content_parts = []
-        for sibling in heading.find_next_siblings():
+        for sibling in heading.next_siblings:
+            if not isinstance(sibling, Tag):
+                continue
             # Stop when we encounter the next heading
-            if isinstance(sibling, Tag) and sibling.name in HEADING_TAGS:
+            if sibling.name in HEADING_TAGS:
                 break
             # Collect text from non-heading elements
-            if sibling.name:
-                text = sibling.get_text(strip=True)
-                if text:
-                    content_parts.append(text)
+            text = sibling.get_text(strip=True)
+            if text:
+                content_parts.append(text)
         # Join all collected content
         content = " ".join(content_parts)
         
@@ -92,8 +153,8 @@ def extract_references(soup: BeautifulSoup) -> List[str]:
     # Look for References heading (h2 with id or text "References")
     ref_section = soup.find(SECONDARY_HEADING_TAGS, string=REFERENCES_HEADING_PATTERN)
     if not ref_section:
-        # Try finding by id
-        ref_section = soup.find(id='references') or soup.find(id='References')
+        # Try finding by id (one tree walk for both spellings)
+        ref_section = soup.find(id=REFERENCES_IDS)
     
     if ref_section:
         # Get all content after references section
@@ -103,15 +164,8 @@ def extract_references(soup: BeautifulSoup) -> List[str]:
             if current.name in MAJOR_HEADING_TAGS:
                 break
             
-            # Extract all links from ordered/unordered lists
-            if current.name in SECTION_TAGS:
-                for link in current.find_all('a', href=True):
-                    href = link.get('href', '')
-                    if href.startswith('http'):
-                        references.append(href)
-            
-            # Extract links from paragraphs or divs
-            elif current.name in TEXT_CONTAINER_TAGS:
+            # Extract all links from ordered/unordered lists, paragraphs or divs
+            if current.name in SECTION_TAGS or current.name in TEXT_CONTAINER_TAGS:
                 for link in current.find_all('a', href=True):
                     href = link.get('href', '')
                     if href.startswith('http'):
@@ -121,29 +175,61 @@ def extract_references(soup: BeautifulSoup) -> List[str]:
     
     # Fallback: Find all external links (excluding Grokipedia itself)
     if not references:
-        all_links = soup.find_all('a', href=True)
-        for link in all_links:
-            href = link.get('href', '')
-            if href.startswith('http') and 'grokipedia.com' not in href:
-                references.append(href)
+        is_external = EXTERNAL_LINK_PATTERN.match
+        hrefs = (link['href'] for link in soup.find_all('a', href=True))
+        references = [href for href in hrefs if is_external(href)]
     
     # Remove duplicates while preserving order
-    seen = set()
-    unique_refs = []
-    for ref in references:
-        if ref not in seen:
-            seen.add(ref)
-            unique_refs.append(ref)
+    return list(dict.fromkeys(references))
+
+
+def _first_raw_text_node(html_text: str, pattern: re.Pattern) -> Tuple[bool, Optional[str]]:
+    """
+    Find the raw HTML text node holding the first match of ``pattern``.
     
-    return unique_refs
+    Markup is tokenized with MARKUP_TOKEN_PATTERN up to the match, so '>' in
+    attribute values and text inside comments or scripts aren't mistaken for
+    text nodes. A match inside markup can't be resolved from the raw page.
+    
+    Args:
+        html_text: Raw HTML document
+        pattern: Compiled pattern to locate
+        
+    Returns:
+        Tuple of (resolved, text): ``(True, None)`` if the page has no match,
+        ``(True, text)`` with the unescaped text node holding the first match,
+        or ``(False, None)`` if that match lies inside or next to markup the
+        scan couldn't tokenize
+    """
+    match = pattern.search(html_text)
+    if match is None:
+        return True, None
+    node_start, node_end = 0, len(html_text)
+    for token in MARKUP_TOKEN_PATTERN.finditer(html_text):
+        if token.end() <= match.start():
+            node_start = token.end()
+        elif token.start() < match.end():
+            return False, None
+        else:
+            node_end = token.start()
+            break
+    text_node = html_text[node_start:node_end]
+    if STRAY_MARKUP_PATTERN.search(text_node):
+        return False, None
+    return True, html.unescape(text_node)
 
 
-def extract_fact_check_info(soup: BeautifulSoup) -> Optional[str]:
+def extract_fact_check_info(soup: BeautifulSoup, html_text: Optional[str] = None) -> Optional[str]:
     """
     Extract fact-check information if available.
     
+    When the raw document is supplied, the page text is searched with the
+    precompiled pattern directly instead of walking every text node in the tree,
+    falling back to the tree when the raw match isn't a plain text node.
+    
     Args:
         soup: BeautifulSoup object of the article
+        html_text: Optional raw HTML the soup was parsed from
         
     Returns:
         Fact-check information or None
@@ -153,22 +239,29 @@ def extract_fact_check_info(soup: BeautifulSoup) -> Optional[str]:
     if meta_desc:
         content = meta_desc.get('content', '')
         if 'Fact-checked' in content:
-            match = re.search(r'Fact-checked by (.+?)(?:\.|$)', content)
+            match = FACT_CHECK_META_PATTERN.search(content)
             if match:
                 return match.group(1).strip()
     
-    # Method 2: Look for text in the page - search all text nodes for the pattern
-    for element in soup.find_all(string=True):
-        text = str(element).strip()
-        if FACT_CHECK_PATTERN.search(text):
-            # Extract just the fact-check info
-            match = re.search(FACT_CHECK_EXTRACT_PATTERN, text)
-            if match:
-                fact_check = match.group(1).strip()
-                # Clean up extra whitespace and trailing punctuation
-                fact_check = ' '.join(fact_check.split())
-                fact_check = fact_check.rstrip('.,;:!?')
-                return fact_check
+    # Method 2: Look for text in the page - only text nodes containing the pattern
+    text_nodes = None
+    if html_text is not None:
+        resolved, text_node = _first_raw_text_node(html_text, FACT_CHECK_PATTERN)
+        if resolved and text_node is None:
+            text_nodes = []
+        elif resolved and FACT_CHECK_EXTRACT_PATTERN.search(text_node.strip()):
+            text_nodes = [text_node]
+    if text_nodes is None:
+        text_nodes = soup.find_all(string=FACT_CHECK_PATTERN)
+    for element in text_nodes:
+        # Extract just the fact-check info
+        match = FACT_CHECK_EXTRACT_PATTERN.search(str(element).strip())
+        if match:
+            fact_check = match.group(1).strip()
+            # Clean up extra whitespace and trailing punctuation
+            fact_check = ' '.join(fact_check.split())
+            fact_check = fact_check.rstrip('.,;:!?')
+            return fact_check
     
     return None
 
@@ -200,16 +293,11 @@ def extract_summary(soup: BeautifulSoup, title_tag: Optional[Tag]) -> str:
     # Try to find main article content area
     main_content = soup.find('article') or soup.find('main') or soup
     
-    # Look for first substantial paragraph after h1
+    # Look for first substantial paragraph after h1, stopping at the first match
     if title_tag:
-        # Use list comprehension for efficient text extraction
-        candidates = [
-            sibling.get_text(strip=True)
-            for sibling in title_tag.find_next_siblings(['p', 'div'])
-        ]
-        for text in candidates:
-            # Look for substantial content (intro paragraph is usually 200+ chars)
-            if len(text) > MIN_SUMMARY_LENGTH and not text.startswith('Jump to') and not text.startswith('From '):
+        for sibling in title_tag.find_next_siblings(TEXT_CONTAINER_TAGS):
+            text = sibling.get_text(strip=True)
+            if _is_summary_candidate(text):
                 return text
     
     # Last resort: first substantial paragraph anywhere
@@ -218,7 +306,7 @@ def extract_summary(soup: BeautifulSoup, title_tag: Optional[Tag]) -> str:
     paragraph_texts = [p.get_text(strip=True) for p in paragraphs]
     
     for text in paragraph_texts:
-        if len(text) > MIN_SUMMARY_LENGTH and not text.startswith('Jump to') and not text.startswith('From '):
+        if _is_summary_candidate(text):
             return text
     
     # If no substantial paragraph found, return first non-empty paragraph
@@ -240,3 +328,148 @@ def clean_html_for_text_extraction(soup: BeautifulSoup) -> None:
     """
     for element in soup(SCRIPT_TAGS):
         element.decompose()
+
+
+def _strip_markup(fragment: str) -> str:
+    """Return the text of an HTML fragment, matching Tag.get_text(strip=True)."""
+    return ''.join(html.unescape(piece).strip() for piece in MARKUP_PATTERN.split(fragment))
+
+
+def _find_og_description(html_text: str) -> str:
+    """Return the first og:description content in HTML already stripped by RAW_TEXT_PATTERN."""
+    for meta in META_TAG_PATTERN.finditer(html_text):
+        # Quoted or unquoted values; like an HTML parser, the first duplicate wins
+        attrs = {}
+        for match in TAG_ATTRIBUTE_PATTERN.finditer(meta.group(0)):
+            name, *values = match.groups()
+            attrs.setdefault(name.lower(), next(value for value in values if value is not None))
+        if attrs.get('property') == OG_DESCRIPTION_META['property']:
+            return html.unescape(attrs.get('content', '')).strip()
+    return ''
+
+
+def extract_og_description_fast(html_text: str) -> Optional[str]:
+    """
+    Extract the og:description meta content using regular expressions only.
+    
+    Meta tags inside comments, scripts and styles are ignored, as they would
+    be by a parser.
+    
+    Args:
+        html_text: Raw HTML of the page
+        
+    Returns:
+        The description, or None if the page has no non-empty og:description
+    """
+    return _find_og_description(RAW_TEXT_PATTERN.sub('', html_text)) or None
+
+
+def extract_summary_fast(html_text: str) -> Optional[Tuple[str, str, List[str]]]:
+    """
+    Extract title, summary and table of contents using regular expressions only.
+    
+    Covers the common page layout (og:description meta tag plus an h1 title)
+    without building a BeautifulSoup tree. Pages that don't fit that layout
+    return None so the caller can fall back to the full parser.
+    
+    Args:
+        html_text: Raw HTML of the article page
+        
+    Returns:
+        Tuple of (title, summary, table of contents list), or None if the
+        page needs the full parser
+    """
+    html_text = RAW_TEXT_PATTERN.sub('', html_text)
+    
+    summary = _find_og_description(html_text)
+    if not summary:
+        return None
+    
+    title = None
+    toc = []
+    for match in HEADING_PATTERN.finditer(html_text):
+        text = _strip_markup(match.group(2))
+        if match.group(1) == '1':
+            if title is None:
+                title = text
+            continue
+        if not text:
+            # Empty headings need the full parser's handling
+            return None
+        toc.append(text)
+    
+    if not title:
+        return None
+    
+    return title, summary, toc
+
+
+def _element_text(element) -> str:
+    """Return the text of an lxml element, matching Tag.get_text(strip=True)."""
+    return ''.join(text.strip() for text in _TEXT_XPATH(element))
+
+
+def _is_summary_candidate(text: str) -> bool:
+    """Check whether paragraph text looks like the article's intro paragraph."""
+    # Intro paragraphs are usually 200+ characters
+    return len(text) > MIN_SUMMARY_LENGTH and not text.startswith(SUMMARY_SKIP_PREFIXES)
+
+
+def extract_summary_lxml(html_text: str) -> Optional[Tuple[Optional[str], str, List[str]]]:
+    """
+    Extract title, summary and table of contents with lxml and XPath.
+    
+    Follows the same rules as extract_summary() and extract_sections(), but
+    queries the libxml2 tree directly instead of building BeautifulSoup
+    objects for every node.
+    
+    Args:
+        html_text: Raw HTML of the article page
+        
+    Returns:
+        Tuple of (title or None if the page has no h1, summary, table of
+        contents list), or None if lxml is unavailable or the page needs the
+        BeautifulSoup parser
+    """
+    if not HAS_LXML:
+        return None
+    try:
+        root = lxml.html.fromstring(html_text)
+    except (etree.ParserError, ValueError):
+        # Empty documents and strings with an XML encoding declaration
+        return None
+    
+    title_tags = _TITLE_XPATH(root)
+    title_tag = title_tags[0] if title_tags else None
+    title = _element_text(title_tag) if title_tag is not None else None
+    toc = [_element_text(heading) for heading in _SUBHEADINGS_XPATH(root)]
+    if not all(toc):
+        # Empty headings need the full parser's handling
+        return None
+    
+    # Meta description first; an og:description tag wins even when it is empty
+    metas = _OG_DESCRIPTION_XPATH(root) or _DESCRIPTION_XPATH(root)
+    if metas:
+        content = (metas[0].get('content') or '').strip()
+        if content:
+            return title, content, toc
+    
+    # Fallback: first substantial paragraph after the title
+    if title_tag is not None:
+        for sibling in _TITLE_SIBLINGS_XPATH(title_tag):
+            text = _element_text(sibling)
+            if _is_summary_candidate(text):
+                return title, text, toc
+    
+    # Last resort: paragraphs in the main content area
+    content_roots = _ARTICLE_XPATH(root) or _MAIN_XPATH(root)
+    main_content = content_roots[0] if content_roots else root.getroottree().getroot()
+    paragraph_texts = [_element_text(p) for p in _PARAGRAPHS_XPATH(main_content)]
+    for text in paragraph_texts:
+        if _is_summary_candidate(text):
+            return title, text, toc
+    for text in paragraph_texts:
+        if text and len(text) > MIN_FALLBACK_SUMMARY_LENGTH:
+            return title, text, toc
+    
+    return title, "", toc
@@ -550,10 +550,10 @@ class SlugIndex:
             True
         """
         index = self.load()
-        slug_lower = slug.lower()
         
-        # Check both normalized and original forms
-        return slug_lower in index or slug in set(index.values())
+        # load() keys every slug by its lowercase form, so one dict lookup covers
+        # exact matches without scanning the index values
+        return slug.lower() in index
     
     def list_by_prefix(self, prefix: str = "", limit: int = 100) -> List[str]:
         """
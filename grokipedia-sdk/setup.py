@@ -41,16 +41,24 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "httpx>=0.25.0",
+        "httpx>=0.27.0",
         "beautifulsoup4>=4.12.0",
         "pydantic>=2.0.0",
         "lxml>=4.9.0",
         "rapidfuzz>=3.0.0",
     ],
     extras_require={
+        "compression": [
+            "brotli>=1.0.0",
+            "zstandard>=0.18.0",
+        ],
+        "http2": [
+            "h2>=3.0.0,<5.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
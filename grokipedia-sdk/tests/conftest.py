@@ -0,0 +1,274 @@
+"""Shared pytest fixtures for the Grokipedia SDK test suite"""
+
+import functools
+import os
+import pickle
+
+import httpx
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from pydantic import HttpUrl, TypeAdapter
+
+from grokipedia_sdk import Client
+from grokipedia_sdk.client import _PARSE_MEMO, _env_base_url
+from grokipedia_sdk.models import Article, ArticleMetadata, ArticleSummary, Section
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration, which call the live Grokipedia site",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --run-integration was given"""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(autouse=True)
+def clear_env_base_url_cache():
+    """Re-read GROKIPEDIA_BASE_URL in every test, so patch.dict(os.environ) takes effect"""
+    _env_base_url.cache_clear()
+    yield
+    _env_base_url.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_memo():
+    """Start every test with an empty process-wide parse memo"""
+    _PARSE_MEMO.clear()
+    yield
+    _PARSE_MEMO.clear()
+
+
+class FakeClock:
+    """
+    Deterministic stand-in for the ``time`` module as used by grokipedia_sdk.client.
+    
+    ``monotonic()`` returns the fake time, ``sleep(dt)`` advances it instantly and
+    records the delay, and ``advance(dt)`` simulates time passing between calls.
+    """
+    
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self.sleeps = []
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+    
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive the client's rate limiter and retry sleeps with a FakeClock"""
+    clock = FakeClock()
+    # Replace the client module's reference only, so other code keeps the real clock
+    monkeypatch.setattr("grokipedia_sdk.client.time", clock)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def default_client():
+    """A default-configured Client shared by read-only tests in a module"""
+    client = Client()
+    yield client
+    client.close()
+
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+@functools.lru_cache(maxsize=32)
+def _validated_url(url: str) -> HttpUrl:
+    return _HTTP_URL.validate_python(url)
+
+
+@pytest.fixture(scope="session")
+def http_url():
+    """
+    Return a function that turns a URL string into a validated HttpUrl.
+    
+    Each distinct string is parsed once per session. Use it where a test only
+    needs some valid URL, not where URL validation is what's being tested.
+    """
+    return _validated_url
+
+
+@pytest.fixture(scope="session")
+def valid_metadata():
+    """A default ArticleMetadata shared by tests that only read it"""
+    return ArticleMetadata()
+
+
+@pytest.fixture(scope="session")
+def valid_section():
+    """A validated Section shared by tests that only read it"""
+    return Section(title="Section 1", level=2)
+
+
+@pytest.fixture(scope="session")
+def valid_article(valid_section):
+    """A fully populated, validated Article shared by tests that only read it"""
+    return Article(
+        title="Test Article",
+        slug="Test_Article",
+        url="https://example.com/page/Test_Article",
+        summary="Summary",
+        full_content="Full content",
+        sections=[valid_section],
+        table_of_contents=["Section 1"],
+        references=["https://example.com/ref1"],
+        metadata=ArticleMetadata(word_count=1000),
+        scraped_at="2024-01-01T00:00:00Z"
+    )
+
+
+@pytest.fixture(scope="session")
+def valid_summary():
+    """A validated ArticleSummary shared by tests that only read it"""
+    return ArticleSummary(
+        title="Test Article",
+        slug="Test_Article",
+        url="https://example.com/page/Test_Article",
+        summary="Summary text",
+        table_of_contents=["Section 1", "Section 2"],
+        scraped_at="2024-01-01T00:00:00Z"
+    )
+
+
+@pytest.fixture(scope="session")
+def live_client():
+    """A default Client shared by integration tests for the whole session"""
+    with Client() as client:
+        yield client
+
+
+DEBUG_CACHE_DIR = "grokipedia_debug"  # Under the project's pytest cache directory
+
+
+@pytest.fixture(scope="session")
+def debug_cached(pytestconfig):
+    """
+    Wrap expensive calls so local reruns can replay their results from disk.
+    
+    With GROKIPEDIA_DEBUG_CACHE set, ``debug_cached(func)`` returns a wrapper that
+    stores each result under ``(func.__name__, repr(args), repr(kwargs))`` in a
+    pickle in the project's pytest cache (``.pytest_cache/d/grokipedia_debug``),
+    so later sessions skip the call. Otherwise, or when the cache provider is
+    disabled, it returns ``func`` unchanged. Run with --cache-clear to refresh.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if not os.environ.get("GROKIPEDIA_DEBUG_CACHE") or cache is None:
+        yield lambda func: func
+        return
+    
+    # Kept inside the project rather than the shared temp directory, where another
+    # local user could plant a pickle for us to load
+    path = cache.mkdir(DEBUG_CACHE_DIR) / "results.pickle"
+    try:
+        with open(path, "rb") as f:
+            store = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        store = {}
+    
+    def wrap(func):
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            key = (func.__name__, repr(args), repr(kwargs))
+            if key not in store:
+                store[key] = func(*args, **kwargs)
+            return store[key]
+        return cached
+    
+    yield wrap
+    
+    with open(path, "wb") as f:
+        pickle.dump(store, f)
+
+
+@pytest.fixture
+def mock_httpx(monkeypatch):
+    """
+    Replace the httpx clients and transports used by grokipedia_sdk.client with mocks.
+    
+    Returns a namespace of the patched classes; the client instances a Client
+    builds are ``client_class.return_value`` and ``async_client_class.return_value``.
+    """
+    mocks = SimpleNamespace(
+        client_class=Mock(return_value=Mock()),
+        async_client_class=Mock(return_value=Mock(aclose=AsyncMock())),
+        transport_class=Mock(),
+        async_transport_class=Mock(),
+    )
+    monkeypatch.setattr("grokipedia_sdk.client.httpx.Client", mocks.client_class)
+    monkeypatch.setattr("grokipedia_sdk.client.httpx.AsyncClient", mocks.async_client_class)
+    monkeypatch.setattr("grokipedia_sdk.client.httpx.HTTPTransport", mocks.transport_class)
+    monkeypatch.setattr("grokipedia_sdk.client.httpx.AsyncHTTPTransport", mocks.async_transport_class)
+    return mocks
+
+
+@pytest.fixture
+def mock_transport():
+    """
+    Factory for httpx.MockTransport instances to pass as Client(transport=...).
+    
+    Call it with a handler ``(request) -> httpx.Response``, or with a list of
+    responses to return in order (the last one repeats). Requests the transport
+    received are recorded on its ``requests`` list.
+    """
+    def make(handler_or_responses):
+        requests = []
+        if callable(handler_or_responses):
+            handler = handler_or_responses
+        else:
+            responses = list(handler_or_responses)
+            handler = lambda request: responses.pop(0) if len(responses) > 1 else responses[0]
+        
+        def handle(request):
+            requests.append(request)
+            return handler(request)
+        
+        transport = httpx.MockTransport(handle)
+        transport.requests = requests
+        return transport
+    
+    return make
+
+
+@pytest.fixture
+def fake_response():
+    """
+    Factory for lightweight response doubles with the attributes Client reads.
+    
+    Call it as ``fake_response(status_code, text)``. ``raise_for_status`` raises
+    httpx.HTTPStatusError for 4xx/5xx statuses, like a real httpx.Response.
+    Use this instead of ``Mock()`` when nothing inspects the response's calls.
+    """
+    def make(status_code=200, text="", headers=None):
+        response = SimpleNamespace(status_code=status_code, text=text, headers=headers or {})
+        
+        def raise_for_status():
+            if status_code >= 400:
+                raise httpx.HTTPStatusError(
+                    f"HTTP {status_code}", request=None, response=response
+                )
+        
+        response.raise_for_status = raise_for_status
+        return response
+    
+    return make
@@ -2,6 +2,8 @@
 
 import pytest
 import asyncio
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, AsyncMock
 from grokipedia_sdk import Client, ArticleNotFound, RequestError
 from grokipedia_sdk.models import Article, ArticleSummary
@@ -44,59 +46,54 @@ class TestClientAsyncMethods:
     """Test Client async methods"""
     
     @pytest.mark.asyncio
-    @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_article_async_success(self, mock_async_client_class):
+    async def test_get_article_async_success(self, mock_transport):
         """Test successful async article fetch"""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
         
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__.return_value = mock_async_client
-        mock_async_client.__aexit__.return_value = None
-        mock_async_client.get = AsyncMock(return_value=mock_response)
-        mock_async_client_class.return_value = mock_async_client
-        
-        client = Client(base_url="https://test.com")
+        client = Client(base_url="https://test.com", async_transport=transport)
         article = await client.get_article_async("Joe_Biden")
         
         assert isinstance(article, Article)
         assert article.title == "Joe Biden"
         assert article.slug == "Joe_Biden"
         assert len(article.sections) >= 1
+        assert str(transport.requests[0].url) == "https://test.com/page/Joe_Biden"
+        await client.aclose()
     
     @pytest.mark.asyncio
-    @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_summary_async_success(self, mock_async_client_class):
+    async def test_get_summary_async_success(self, mock_transport):
         """Test successful async summary fetch"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_SUMMARY_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_SUMMARY_HTML)])
         
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__.return_value = mock_async_client
-        mock_async_client.__aexit__.return_value = None
-        mock_async_client.get = AsyncMock(return_value=mock_response)
-        mock_async_client_class.return_value = mock_async_client
-        
-        client = Client(base_url="https://test.com")
+        client = Client(base_url="https://test.com", async_transport=transport)
         summary = await client.get_summary_async("Joe_Biden")
         
         assert isinstance(summary, ArticleSummary)
         assert summary.title == "Joe Biden"
         assert summary.slug == "Joe_Biden"
+        await client.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_get_article_async_304_uses_cache(self, mock_transport):
+        """Test that an async refresh answered with 304 returns the cached article"""
+        transport = mock_transport([
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, async_transport=transport)
+        article = await client.get_article_async("Joe_Biden")
+        refreshed = await client.get_article_async("Joe_Biden", refresh=True)
+        
+        assert refreshed is article
+        assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+        await client.aclose()
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_article_async_caching(self, mock_async_client_class):
+    async def test_get_article_async_caching(self, mock_async_client_class, fake_response):
         """Test that async articles are cached"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -122,15 +119,9 @@ class TestClientAsyncErrorHandling:
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_article_async_404_raises_article_not_found(self, mock_async_client_class):
+    async def test_get_article_async_404_raises_article_not_found(self, mock_async_client_class, fake_response):
         """Test that async 404 raises ArticleNotFound"""
-        import httpx
-        
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status = Mock(side_effect=httpx.HTTPStatusError(
-            "Not Found", request=Mock(), response=mock_response
-        ))
+        mock_response = fake_response(404)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -145,20 +136,10 @@ class TestClientAsyncErrorHandling:
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_article_async_retries_on_500(self, mock_async_client_class):
+    async def test_get_article_async_retries_on_500(self, mock_async_client_class, fake_response):
         """Test that async methods retry on server errors"""
-        import httpx
-        
-        mock_response_500 = Mock()
-        mock_response_500.status_code = 500
-        mock_response_500.raise_for_status = Mock(side_effect=httpx.HTTPStatusError(
-            "Internal Server Error", request=Mock(), response=mock_response_500
-        ))
-        
-        mock_response_200 = Mock()
-        mock_response_200.text = SAMPLE_ARTICLE_HTML
-        mock_response_200.status_code = 200
-        mock_response_200.raise_for_status = Mock()
+        mock_response_500 = fake_response(500)
+        mock_response_200 = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -175,41 +156,30 @@ class TestClientAsyncErrorHandling:
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_article_async_connection_error_retries(self, mock_async_client_class):
-        """Test that async connection errors retry"""
+    async def test_get_article_async_connection_error_not_retried_by_client(self, mock_async_client_class):
+        """Test that async connection errors are left to the transport's retries"""
         import httpx
         
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
         mock_async_client.__aexit__.return_value = None
-        mock_async_client.get = AsyncMock(side_effect=[
-            httpx.ConnectError("Connection failed"),
-            mock_response
-        ])
+        mock_async_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
         mock_async_client_class.return_value = mock_async_client
         
         client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
         
-        article = await client.get_article_async("Joe_Biden")
+        with pytest.raises(RequestError):
+            await client.get_article_async("Joe_Biden")
         
-        assert isinstance(article, Article)
-        assert mock_async_client.get.call_count == 2
+        assert mock_async_client.get.call_count == 1
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_get_article_async_timeout_retries(self, mock_async_client_class):
+    async def test_get_article_async_timeout_retries(self, mock_async_client_class, fake_response):
         """Test that async timeout errors retry"""
         import httpx
         
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -234,13 +204,9 @@ class TestClientAsyncRateLimiting:
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
     @patch('grokipedia_sdk.client.asyncio.sleep')
-    @patch('grokipedia_sdk.client.time.time')
-    async def test_async_rate_limiting_enforced(self, mock_time, mock_sleep, mock_async_client_class):
+    async def test_async_rate_limiting_enforced(self, mock_sleep, mock_async_client_class, fake_response):
         """Test that async rate limiting delays requests"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -248,21 +214,20 @@ class TestClientAsyncRateLimiting:
         mock_async_client.get = AsyncMock(return_value=mock_response)
         mock_async_client_class.return_value = mock_async_client
         
-        # Mock time to return same value (simulating immediate second call)
-        def time_side_effect():
-            return 0.0
-        mock_time.side_effect = time_side_effect
-        
-        client = Client(base_url="https://test.com", rate_limit=1.0, max_retries=0)
-        
-        # First request
-        await client.get_article_async("Article1")
-        
-        # Second request (should delay because elapsed < rate_limit)
-        await client.get_article_async("Article2")
-        
-        # Verify sleep was called
-        assert mock_sleep.called
+        # Only the client's clock is frozen; the event loop keeps its real monotonic time
+        clock = Mock(monotonic=Mock(return_value=0.0))
+        with patch('grokipedia_sdk.client.time', clock):
+            client = Client(base_url="https://test.com", rate_limit=1.0, max_retries=0)
+            
+            # First request
+            await client.get_article_async("Article1")
+            assert not mock_sleep.called
+            
+            # Second request (should delay because no time has passed)
+            await client.get_article_async("Article2")
+        
+        # Verify sleep was called for one full interval
+        mock_sleep.assert_called_once_with(1.0)
 
 
 class TestClientConcurrentAsyncRequests:
@@ -270,12 +235,9 @@ class TestClientConcurrentAsyncRequests:
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_concurrent_async_requests(self, mock_async_client_class):
+    async def test_concurrent_async_requests(self, mock_async_client_class, fake_response):
         """Test that multiple async requests can run concurrently"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -296,14 +258,73 @@ class TestClientConcurrentAsyncRequests:
         assert all(isinstance(article, Article) for article in articles)
         assert mock_async_client.get.call_count == 3
     
+    @pytest.mark.asyncio
+    async def test_concurrent_async_requests_for_same_slug_coalesce(self, mock_transport):
+        """Test that concurrent async fetches of one slug share a single request"""
+        async def slow_handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text=SAMPLE_ARTICLE_HTML)
+        
+        transport = mock_transport(slow_handler)
+        client = Client(base_url="https://test.com", rate_limit=0, async_transport=transport)
+        
+        articles = await asyncio.gather(*[client.get_article_async("Joe_Biden") for _ in range(5)])
+        
+        assert len(transport.requests) == 1
+        assert all(article is articles[0] for article in articles)
+        await client.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_cancelling_leader_does_not_cancel_waiters(self, mock_transport):
+        """Test that a waiter on a shared fetch still gets the article if the fetching caller is cancelled"""
+        async def slow_handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text=SAMPLE_ARTICLE_HTML)
+        
+        transport = mock_transport(slow_handler)
+        client = Client(base_url="https://test.com", rate_limit=0, async_transport=transport)
+        
+        leader = asyncio.create_task(client.get_article_async("Joe_Biden"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(client.get_article_async("Joe_Biden"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        article = await waiter
+        
+        assert article.title == "Joe Biden"
+        assert client._inflight_async == {}
+        await client.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_sync_fetch_on_loop_thread_does_not_wait_for_async_fetch(self, mock_transport):
+        """Test that get_article() on the event loop's thread doesn't block on an async fetch it can't finish"""
+        async def slow_handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text=SAMPLE_ARTICLE_HTML)
+        
+        sync_transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        async_transport = mock_transport(slow_handler)
+        client = Client(base_url="https://test.com", rate_limit=0,
+                        transport=sync_transport, async_transport=async_transport)
+        
+        leader = asyncio.create_task(client.get_article_async("Joe_Biden"))
+        await asyncio.sleep(0.01)
+        article = client.get_article("Joe_Biden")
+        
+        assert article.title == "Joe Biden"
+        assert (await leader).title == "Joe Biden"
+        assert len(sync_transport.requests) == 1
+        assert len(async_transport.requests) == 1
+        await client.aclose()
+    
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_concurrent_async_summaries(self, mock_async_client_class):
+    async def test_concurrent_async_summaries(self, mock_async_client_class, fake_response):
         """Test concurrent async summary requests"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_SUMMARY_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_SUMMARY_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -326,17 +347,10 @@ class TestClientConcurrentAsyncRequests:
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_concurrent_mixed_async_requests(self, mock_async_client_class):
+    async def test_concurrent_mixed_async_requests(self, mock_async_client_class, fake_response):
         """Test concurrent mixed article and summary requests"""
-        mock_article_response = Mock()
-        mock_article_response.text = SAMPLE_ARTICLE_HTML
-        mock_article_response.status_code = 200
-        mock_article_response.raise_for_status = Mock()
-        
-        mock_summary_response = Mock()
-        mock_summary_response.text = SAMPLE_SUMMARY_HTML
-        mock_summary_response.status_code = 200
-        mock_summary_response.raise_for_status = Mock()
+        mock_article_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        mock_summary_response = fake_response(200, SAMPLE_SUMMARY_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
@@ -365,22 +379,172 @@ class TestClientConcurrentAsyncRequests:
         assert mock_async_client.get.call_count == 3
 
 
+class TestClientBatchAsyncRequests:
+    """Test batched async article fetching"""
+    
+    @pytest.mark.asyncio
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    async def test_get_articles_async_preserves_order(self, mock_async_client_class, fake_response):
+        """Test that batched fetch returns articles in input order"""
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(return_value=mock_response)
+        mock_async_client_class.return_value = mock_async_client
+        
+        client = Client(base_url="https://test.com", rate_limit=0, max_retries=0)
+        
+        slugs = [f"Article{i}" for i in range(10)]
+        articles = await client.get_articles_async(slugs)
+        
+        assert [article.slug for article in articles] == slugs
+        assert mock_async_client.get.call_count == 10
+    
+    @pytest.mark.asyncio
+    async def test_get_articles_async_shares_one_transport(self, mock_transport):
+        """Test that a batch goes through the client's single pooled transport"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        client = Client(base_url="https://test.com", rate_limit=0, async_transport=transport)
+        
+        slugs = [f"Article{i}" for i in range(10)]
+        articles = await client.get_articles_async(slugs)
+        
+        assert len(articles) == 10
+        assert len(transport.requests) == 10
+        assert client._async_client._transport is transport
+        await client.aclose()
+    
+    @pytest.mark.asyncio
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    async def test_get_articles_async_limits_concurrency(self, mock_async_client_class, fake_response):
+        """Test that no more than max_concurrency requests are in flight"""
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        
+        in_flight = 0
+        peak = 0
+        
+        async def slow_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_response
+        
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(side_effect=slow_get)
+        mock_async_client_class.return_value = mock_async_client
+        
+        client = Client(base_url="https://test.com", rate_limit=0, max_retries=0)
+        
+        articles = await client.get_articles_async(
+            [f"Article{i}" for i in range(12)], max_concurrency=3
+        )
+        
+        assert len(articles) == 12
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    async def test_get_articles_async_return_exceptions(self, mock_async_client_class, fake_response):
+        """Test that failures can be returned in place instead of raised"""
+        mock_response_200 = fake_response(200, SAMPLE_ARTICLE_HTML)
+        mock_response_404 = fake_response(404)
+        
+        async def get(url, **kwargs):
+            return mock_response_404 if url.endswith("Missing") else mock_response_200
+        
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(side_effect=get)
+        mock_async_client_class.return_value = mock_async_client
+        
+        client = Client(base_url="https://test.com", rate_limit=0, max_retries=0)
+        
+        results = await client.get_articles_async(
+            ["Joe_Biden", "Missing"], return_exceptions=True
+        )
+        
+        assert isinstance(results[0], Article)
+        assert isinstance(results[1], ArticleNotFound)
+    
+    @pytest.mark.asyncio
+    async def test_get_articles_async_rejects_invalid_concurrency(self):
+        """Test that max_concurrency must be positive"""
+        client = Client(base_url="https://test.com")
+        
+        with pytest.raises(ValueError):
+            await client.get_articles_async(["Joe_Biden"], max_concurrency=0)
+
+
+class TestClientAsyncParseOffload:
+    """Test offloading large page parses to worker processes"""
+    
+    LARGE_ARTICLE_HTML = SAMPLE_ARTICLE_HTML.replace(
+        "</body>", "<p>" + "Filler text. " * 2000 + "</p></body>"
+    )
+    
+    @pytest.mark.asyncio
+    @patch('grokipedia_sdk.client.ProcessPoolExecutor', ThreadPoolExecutor)
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    async def test_large_page_parsed_in_executor(self, mock_async_client_class, fake_response):
+        """Test that large pages are parsed in the executor when enabled"""
+        mock_response = fake_response(200, self.LARGE_ARTICLE_HTML)
+        
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(return_value=mock_response)
+        mock_async_client_class.return_value = mock_async_client
+        
+        client = Client(base_url="https://test.com", rate_limit=0, parse_workers=2)
+        article = await client.get_article_async("Joe_Biden")
+        
+        assert isinstance(article, Article)
+        assert article.title == "Joe Biden"
+        assert client._resources.parse_executor is not None
+        
+        await client.aclose()
+        assert client._resources.parse_executor is None
+    
+    @pytest.mark.asyncio
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    async def test_small_page_parsed_inline(self, mock_async_client_class, fake_response):
+        """Test that small pages skip the executor"""
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(return_value=mock_response)
+        mock_async_client_class.return_value = mock_async_client
+        
+        client = Client(base_url="https://test.com", rate_limit=0, parse_workers=2)
+        article = await client.get_article_async("Joe_Biden")
+        
+        assert isinstance(article, Article)
+        assert client._resources.parse_executor is None
+    
+    @pytest.mark.asyncio
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    async def test_offload_disabled_by_default(self, mock_async_client_class, fake_response):
+        """Test that parsing stays inline unless parse_workers is set"""
+        mock_response = fake_response(200, self.LARGE_ARTICLE_HTML)
+        
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(return_value=mock_response)
+        mock_async_client_class.return_value = mock_async_client
+        
+        client = Client(base_url="https://test.com", rate_limit=0)
+        await client.get_article_async("Joe_Biden")
+        
+        assert client._resources.parse_executor is None
+
+
 class TestClientAsyncIntegration:
     """Integration tests for async methods"""
     
     @pytest.mark.asyncio
     @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    async def test_async_article_then_summary(self, mock_async_client_class):
+    async def test_async_article_then_summary(self, mock_async_client_class, fake_response):
         """Test fetching article then summary async"""
-        mock_article_response = Mock()
-        mock_article_response.text = SAMPLE_ARTICLE_HTML
-        mock_article_response.status_code = 200
-        mock_article_response.raise_for_status = Mock()
-        
-        mock_summary_response = Mock()
-        mock_summary_response.text = SAMPLE_SUMMARY_HTML
-        mock_summary_response.status_code = 200
-        mock_summary_response.raise_for_status = Mock()
+        mock_article_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        mock_summary_response = fake_response(200, SAMPLE_SUMMARY_HTML)
         
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
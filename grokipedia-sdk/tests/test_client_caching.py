@@ -1,9 +1,10 @@
 """Tests for Client caching behavior and LRU eviction"""
 
+import httpx
 import pytest
 from unittest.mock import Mock, patch
 from grokipedia_sdk import Client
-from grokipedia_sdk.models import Article
+from grokipedia_sdk.models import Article, ArticleSummary
 
 
 SAMPLE_ARTICLE_HTML = """
@@ -23,12 +24,9 @@ class TestClientCaching:
     """Test Client article caching functionality"""
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_article_cached_after_fetch(self, mock_client_class):
+    def test_article_cached_after_fetch(self, mock_client_class, fake_response):
         """Test that articles are cached after first fetch"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -49,12 +47,9 @@ class TestClientCaching:
         assert article1.title == article2.title
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_hit_returns_cached_article(self, mock_client_class):
+    def test_cache_hit_returns_cached_article(self, mock_client_class, fake_response):
         """Test that cache hits return cached articles"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -74,12 +69,9 @@ class TestClientCaching:
         assert article2 is article1  # Should be same object reference
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_miss_fetches_from_network(self, mock_client_class):
+    def test_cache_miss_fetches_from_network(self, mock_client_class, fake_response):
         """Test that cache misses fetch from network"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -96,12 +88,9 @@ class TestClientCaching:
         assert mock_client_instance.get.call_count == 2
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_lru_eviction_when_cache_full(self, mock_client_class):
+    def test_lru_eviction_when_cache_full(self, mock_client_class, fake_response):
         """Test that LRU eviction removes oldest entries when cache is full"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -135,12 +124,80 @@ class TestClientCaching:
         assert "Article4" in client._article_cache
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_size_limit_enforced(self, mock_client_class):
+    def test_concurrent_fetches_of_same_slug_coalesce(self, mock_client_class, fake_response):
+        """Test that simultaneous get_article calls for one slug make a single request"""
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+        
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+        
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = slow_get
+        mock_client_class.return_value = mock_client_instance
+        
+        client = Client(base_url="https://test.com", rate_limit=0)
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            articles = list(pool.map(lambda _: client.get_article("Test_Article"), range(8)))
+        
+        assert mock_client_instance.get.call_count == 1
+        assert all(article is articles[0] for article in articles)
+        assert client._inflight == {}
+    
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_concurrent_fetch_failure_reaches_all_callers(self, mock_client_class, fake_response):
+        """Test that waiting callers see the error from the shared fetch, and the next call retries"""
+        from concurrent.futures import ThreadPoolExecutor
+        from grokipedia_sdk import ArticleNotFound
+        import time
+        
+        mock_response = fake_response(404)
+        
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+        
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = slow_get
+        mock_client_class.return_value = mock_client_instance
+        
+        client = Client(base_url="https://test.com", rate_limit=0)
+        
+        def fetch(_):
+            with pytest.raises(ArticleNotFound):
+                client.get_article("Missing")
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(fetch, range(4)))
+        
+        assert mock_client_instance.get.call_count == 1
+        
+        with pytest.raises(ArticleNotFound):
+            client.get_article("Missing")
+        assert mock_client_instance.get.call_count == 2
+    
+    def test_eviction_drops_cache_validators(self, mock_transport):
+        """Test that evicting an article also forgets its ETag"""
+        transport = mock_transport(
+            lambda request: httpx.Response(200, text=SAMPLE_ARTICLE_HTML,
+                                           headers={"ETag": f'"{request.url.path}"'})
+        )
+        client = Client(base_url="https://test.com", max_cache_size=1, rate_limit=0, transport=transport)
+        
+        client.get_article("Article1")
+        assert client._cache_validators == {"Article1": {"If-None-Match": '"/page/Article1"'}}
+        
+        client.get_article("Article2")
+        assert client._cache_validators == {"Article2": {"If-None-Match": '"/page/Article2"'}}
+    
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_cache_size_limit_enforced(self, mock_client_class, fake_response):
         """Test that cache size limit is enforced"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -157,12 +214,9 @@ class TestClientCaching:
         assert len(client._article_cache) <= 2
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_lru_order_maintained(self, mock_client_class):
+    def test_cache_lru_order_maintained(self, mock_client_class, fake_response):
         """Test that LRU order is maintained correctly"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -183,14 +237,11 @@ class TestClientCaching:
         assert cache_items[-1][0] == "Article1"
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_thread_safety(self, mock_client_class):
+    def test_cache_thread_safety(self, mock_client_class, fake_response):
         """Test that cache operations are thread-safe"""
         import threading
         
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -221,12 +272,9 @@ class TestClientCaching:
             assert slug in client._article_cache
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_not_used_for_summary(self, mock_client_class):
-        """Test that get_summary doesn't use or interfere with article cache"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+    def test_uncached_summaries_do_not_populate_article_cache(self, mock_client_class, fake_response):
+        """Test that summaries of uncached articles are fetched each time without caching an article"""
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -238,7 +286,7 @@ class TestClientCaching:
         summary1 = client.get_summary("Test_Article")
         assert mock_client_instance.get.call_count == 1
         
-        # Fetch summary again - should make new request (summaries not cached)
+        # Fetch summary again - should make new request (no cached article to serve it)
         summary2 = client.get_summary("Test_Article")
         assert mock_client_instance.get.call_count == 2
         
@@ -251,12 +299,29 @@ class TestClientCaching:
         assert mock_client_instance.get.call_count == 3  # Still 3
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_cleared_when_client_closed(self, mock_client_class):
+    def test_summary_served_from_cached_article(self, mock_client_class, fake_response):
+        """Test that get_summary after get_article makes no new request"""
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        
+        mock_client_instance = Mock()
+        mock_client_instance.get.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+        
+        client = Client(base_url="https://test.com", max_cache_size=10)
+        
+        article = client.get_article("Test_Article")
+        assert mock_client_instance.get.call_count == 1
+        
+        summary = client.get_summary("Test_Article")
+        assert mock_client_instance.get.call_count == 1  # Still 1
+        assert isinstance(summary, ArticleSummary)
+        assert summary.title == article.title
+        assert summary.summary == article.summary
+    
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_cache_cleared_when_client_closed(self, mock_client_class, fake_response):
         """Test that cache is cleared when client is closed"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -277,12 +342,9 @@ class TestClientCaching:
         assert hasattr(client, '_article_cache')
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_cache_with_zero_max_size(self, mock_client_class):
+    def test_cache_with_zero_max_size(self, mock_client_class, fake_response):
         """Test behavior with max_cache_size=0 (caching disabled)"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -305,6 +367,80 @@ class TestClientCaching:
         assert mock_client_instance.get.call_count == 3
 
 
+
+class TestParseMemo:
+    """Test the process-wide parse memo keyed by page digest"""
+    
+    LARGE_ARTICLE_HTML = SAMPLE_ARTICLE_HTML.replace(
+        "</body>", "<h2>History</h2><p>" + "Padding text for a large page. " * 1000 + "</p></body>"
+    )
+    
+    def test_parse_cache_hit(self, monkeypatch):
+        """Test that identical large pages are parsed once and returned as fresh copies"""
+        from bs4 import BeautifulSoup
+        
+        soup_class = Mock(wraps=BeautifulSoup)
+        monkeypatch.setattr("grokipedia_sdk.client.BeautifulSoup", soup_class)
+        client = Client(base_url="https://test.com")
+        url = "https://test.com/page/Test_Article"
+        
+        first = client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url)
+        second = client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url)
+        
+        assert soup_class.call_count == 1
+        assert second is not first
+        assert second.model_dump(exclude={"scraped_at"}) == first.model_dump(exclude={"scraped_at"})
+    
+    def test_parse_memo_results_do_not_share_state(self):
+        """Test that mutating a returned article doesn't change later parses of the same page"""
+        client = Client(base_url="https://test.com")
+        url = "https://test.com/page/Test_Article"
+        
+        first = client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url)
+        second = client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url)
+        first.references.append("https://example.com/added")
+        first.sections[0].title = "Renamed"
+        third = client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url)
+        
+        assert second.references is not first.references
+        assert "https://example.com/added" not in third.references
+        assert third.sections[0].title != "Renamed"
+        assert second.model_dump(exclude={"scraped_at"}) == third.model_dump(exclude={"scraped_at"})
+    
+    def test_parse_memo_distinguishes_pages_and_modes(self, monkeypatch):
+        """Test that different HTML, slugs or summary/full modes don't share memo entries"""
+        from bs4 import BeautifulSoup
+        
+        soup_class = Mock(wraps=BeautifulSoup)
+        monkeypatch.setattr("grokipedia_sdk.client.BeautifulSoup", soup_class)
+        client = Client(base_url="https://test.com")
+        url = "https://test.com/page/Test_Article"
+        changed = self.LARGE_ARTICLE_HTML.replace("Padding", "Changed", 1)
+        
+        client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url)
+        client._parse_article_html(changed, "Test_Article", url)
+        client._parse_article_html(self.LARGE_ARTICLE_HTML, "Other", url)
+        summary = client._parse_article_html(self.LARGE_ARTICLE_HTML, "Test_Article", url, full_content=False)
+        
+        assert soup_class.call_count == 3  # The summary takes the no-tree fast path
+        assert isinstance(summary, ArticleSummary)
+    
+    def test_small_pages_not_memoized(self, monkeypatch):
+        """Test that pages below PARSE_MEMO_MIN_LENGTH are always re-parsed"""
+        from bs4 import BeautifulSoup
+        from grokipedia_sdk.client import _PARSE_MEMO
+        
+        soup_class = Mock(wraps=BeautifulSoup)
+        monkeypatch.setattr("grokipedia_sdk.client.BeautifulSoup", soup_class)
+        client = Client(base_url="https://test.com")
+        
+        client._parse_article_html(SAMPLE_ARTICLE_HTML, "Test_Article", "https://test.com/page/Test_Article")
+        client._parse_article_html(SAMPLE_ARTICLE_HTML, "Test_Article", "https://test.com/page/Test_Article")
+        
+        assert soup_class.call_count == 2
+        assert len(_PARSE_MEMO) == 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
@@ -1,12 +1,18 @@
 """Tests for Client configuration, initialization, and context manager"""
 
 import pytest
+import gc
 import os
-from unittest.mock import Mock, patch, MagicMock
+import re
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from grokipedia_sdk import Client, SlugIndex
 from grokipedia_sdk.models import Article
+from grokipedia_sdk.client import DEFAULT_USER_AGENT
 
 
+# Default User-Agent shape: SDK name followed by the "Python SDK" product comment
+_UA_RE = re.compile(r"GrokipediaSDK.*Python SDK")
+
 SAMPLE_ARTICLE_HTML = """
 <html>
 <head>
@@ -37,11 +43,33 @@ class TestClientInitialization:
         assert "GrokipediaSDK" in client.user_agent
         assert isinstance(client._slug_index, SlugIndex)
     
-    def test_custom_base_url(self):
-        """Test Client with custom base_url"""
-        client = Client(base_url="https://custom.example.com")
+    @pytest.mark.parametrize("kwargs,attr,expected", [
+        ({"base_url": "https://custom.example.com"}, "base_url", "https://custom.example.com"),
+        ({"timeout": 60.0}, "timeout", 60.0),
+        ({"max_cache_size": 500}, "max_cache_size", 500),
+        ({"rate_limit": 0.5}, "_rate_limit", 0.5),
+        ({"rate_limit": 0}, "_rate_limit", 0),  # Disables rate limiting
+        ({"max_retries": 5}, "max_retries", 5),
+        ({"max_retries": 0}, "max_retries", 0),  # Disables retries
+        ({"verify": False}, "_verify", False),
+        ({"user_agent": "CustomAgent/1.0"}, "user_agent", "CustomAgent/1.0"),
+    ])
+    def test_custom_param(self, kwargs, attr, expected):
+        """Test that each constructor parameter is stored on the Client"""
+        client = Client(**kwargs)
+        
+        assert getattr(client, attr) == expected
+        assert type(getattr(client, attr)) is type(expected)
+    
+    def test_base_url_strips_repeated_trailing_slashes(self):
+        """Test that every trailing slash is removed from base_url"""
+        client = Client(base_url="https://example.com///")
         
-        assert client.base_url == "https://custom.example.com"
+        assert client.base_url == "https://example.com"
+    
+    def test_default_user_agent_shared(self):
+        """Test that the default User-Agent is a module constant, not rebuilt per Client"""
+        assert Client().user_agent is Client().user_agent
     
     def test_base_url_strips_trailing_slash(self):
         """Test that trailing slashes are removed from base_url"""
@@ -49,81 +77,25 @@ class TestClientInitialization:
         
         assert client.base_url == "https://example.com"
     
-    def test_custom_timeout(self):
-        """Test Client with custom timeout"""
-        client = Client(timeout=60.0)
-        
-        assert client.timeout == 60.0
-    
-    def test_custom_max_cache_size(self):
-        """Test Client with custom cache size"""
-        client = Client(max_cache_size=500)
-        
-        assert client.max_cache_size == 500
-    
-    def test_custom_rate_limit(self):
-        """Test Client with custom rate limit"""
-        client = Client(rate_limit=0.5)
-        
-        assert client._rate_limit == 0.5
-    
-    def test_rate_limit_zero_disables_rate_limiting(self):
-        """Test that rate_limit=0 disables rate limiting"""
-        client = Client(rate_limit=0)
-        
-        assert client._rate_limit == 0
-    
-    def test_custom_max_retries(self):
-        """Test Client with custom max retries"""
-        client = Client(max_retries=5)
-        
-        assert client.max_retries == 5
-    
-    def test_max_retries_zero_disables_retries(self):
-        """Test that max_retries=0 disables retries"""
-        client = Client(max_retries=0)
-        
-        assert client.max_retries == 0
-    
-    def test_custom_verify(self):
-        """Test Client with custom SSL verification"""
-        client = Client(verify=False)
-        
-        assert client._verify is False
-    
-    @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_custom_cert(self, mock_client_class, mock_async_client_class):
+    def test_custom_cert(self, mock_httpx):
         """Test Client with custom certificate"""
-        mock_client_class.return_value = Mock()
-        mock_async_client_class.return_value = Mock()
-        
         client = Client(cert="/path/to/cert.pem")
+        client._client  # HTTP client is created on first access
         
         assert client._cert == "/path/to/cert.pem"
         # Verify httpx.Client was called with cert parameter
-        call_kwargs = mock_client_class.call_args[1]
+        call_kwargs = mock_httpx.client_class.call_args[1]
         assert call_kwargs['cert'] == "/path/to/cert.pem"
     
-    def test_custom_cert_tuple(self):
+    def test_custom_cert_tuple(self, mock_httpx):
         """Test Client with certificate tuple"""
-        with patch('grokipedia_sdk.client.httpx.Client') as mock_client_class, \
-             patch('grokipedia_sdk.client.httpx.AsyncClient') as mock_async_client_class:
-            mock_client_class.return_value = Mock()
-            mock_async_client_class.return_value = Mock()
-            
-            client = Client(cert=("/path/to/cert.pem", "/path/to/key.pem"))
-            
-            assert client._cert == ("/path/to/cert.pem", "/path/to/key.pem")
-            # Verify httpx.Client was called with cert parameter
-            call_kwargs = mock_client_class.call_args[1]
-            assert call_kwargs['cert'] == ("/path/to/cert.pem", "/path/to/key.pem")
-    
-    def test_custom_user_agent(self):
-        """Test Client with custom User-Agent"""
-        client = Client(user_agent="CustomAgent/1.0")
-        
-        assert client.user_agent == "CustomAgent/1.0"
+        client = Client(cert=("/path/to/cert.pem", "/path/to/key.pem"))
+        client._client  # HTTP client is created on first access
+        
+        assert client._cert == ("/path/to/cert.pem", "/path/to/key.pem")
+        # Verify httpx.Client was called with cert parameter
+        call_kwargs = mock_httpx.client_class.call_args[1]
+        assert call_kwargs['cert'] == ("/path/to/cert.pem", "/path/to/key.pem")
     
     def test_custom_slug_index(self):
         """Test Client with custom SlugIndex"""
@@ -132,6 +104,50 @@ class TestClientInitialization:
         
         assert client._slug_index is custom_index
     
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_http_clients_created_lazily(self, mock_client_class, mock_async_client_class):
+        """Test that httpx clients are not built until a request needs them"""
+        client = Client()
+        
+        mock_client_class.assert_not_called()
+        mock_async_client_class.assert_not_called()
+        
+        assert client._client is mock_client_class.return_value
+        assert client._client is mock_client_class.return_value
+        mock_client_class.assert_called_once()
+        mock_async_client_class.assert_not_called()
+    
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_http_client_not_created_after_close(self, mock_client_class):
+        """Test that closing an unused Client does not build an HTTP client"""
+        client = Client()
+        client.close()
+        
+        assert client._client is None
+        mock_client_class.assert_not_called()
+    
+    def test_enable_async_false_skips_async_client_construction(self, mock_httpx):
+        """Test that enable_async=False never builds an httpx.AsyncClient"""
+        import asyncio
+        client = Client(enable_async=False, rate_limit=0)
+        client._client
+        
+        with pytest.raises(RuntimeError, match="enable_async"):
+            asyncio.run(client.get_article_async("Test_Article"))
+        client.close()
+        
+        mock_httpx.client_class.assert_called_once()
+        mock_httpx.async_client_class.assert_not_called()
+    
+    def test_client_has_no_instance_dict(self):
+        """Test that Client uses __slots__ and rejects unknown attributes"""
+        client = Client()
+        
+        assert not hasattr(client, '__dict__')
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1
+    
     def test_default_slug_index_created(self):
         """Test that default SlugIndex is created when not provided"""
         client = Client()
@@ -139,6 +155,13 @@ class TestClientInitialization:
         assert client._slug_index is not None
         assert isinstance(client._slug_index, SlugIndex)
     
+    def test_default_slug_index_shared(self):
+        """Test that Clients without a slug_index share one default SlugIndex"""
+        client1 = Client()
+        client2 = Client()
+        
+        assert client1._slug_index is client2._slug_index
+    
     @patch.dict(os.environ, {'GROKIPEDIA_BASE_URL': 'https://env.example.com'})
     def test_base_url_from_environment_variable(self):
         """Test that base_url is read from environment variable"""
@@ -160,6 +183,15 @@ class TestClientInitialization:
         
         assert client.base_url == "https://grokipedia.com"
     
+    def test_base_url_env_read_once(self):
+        """Test that the environment variable is cached after the first Client"""
+        with patch.dict(os.environ, {'GROKIPEDIA_BASE_URL': 'https://env.example.com'}):
+            Client()
+        with patch.dict(os.environ, {'GROKIPEDIA_BASE_URL': 'https://other.example.com'}):
+            client = Client()
+        
+        assert client.base_url == "https://env.example.com"
+    
     def test_base_url_explicit_overrides_env(self):
         """Test that explicit base_url overrides environment variable"""
         with patch.dict(os.environ, {'GROKIPEDIA_BASE_URL': 'https://env.example.com'}):
@@ -167,28 +199,67 @@ class TestClientInitialization:
         
         assert client.base_url == "https://explicit.example.com"
     
-    @patch('grokipedia_sdk.client.httpx.AsyncClient')
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_httpx_client_initialized_with_params(self, mock_client_class, mock_async_client_class):
+    def test_httpx_client_initialized_with_params(self, mock_httpx):
         """Test that httpx.Client is initialized with correct parameters"""
-        mock_client_class.return_value = Mock()
-        mock_async_client_class.return_value = Mock()
-        
         client = Client(
             base_url="https://test.com",
             timeout=60.0,
             verify=False,
             cert="/path/to/cert.pem"
         )
+        client._client
+        client._async_client
         
         # Verify httpx.Client was called with correct parameters
-        mock_client_class.assert_called_once()
-        call_kwargs = mock_client_class.call_args[1]
+        mock_httpx.client_class.assert_called_once()
+        call_kwargs = mock_httpx.client_class.call_args[1]
         
         assert call_kwargs['timeout'] == 60.0
         assert call_kwargs['verify'] is False
         assert call_kwargs['cert'] == "/path/to/cert.pem"
         assert call_kwargs['follow_redirects'] is True
+        assert call_kwargs['limits'].max_connections == 256
+        assert call_kwargs['limits'].max_keepalive_connections == 32
+        assert call_kwargs['limits'].keepalive_expiry == 15.0
+        
+        # The async client shares the same pool configuration
+        async_kwargs = mock_httpx.async_client_class.call_args[1]
+        assert async_kwargs['limits'] == call_kwargs['limits']
+        
+        # Connection retries happen in the transport, below the request layer
+        assert call_kwargs['transport'] is mock_httpx.transport_class.return_value
+        assert async_kwargs['transport'] is mock_httpx.async_transport_class.return_value
+        assert mock_httpx.transport_class.call_args[1]['retries'] == 3
+        assert mock_httpx.async_transport_class.call_args[1]['retries'] == 3
+    
+    @pytest.mark.parametrize("has_h2,expected", [(True, True), (False, False)])
+    def test_http2_enabled_only_with_h2(self, mock_httpx, monkeypatch, has_h2, expected):
+        """Test that http2=True reaches both transports only when h2 is installed"""
+        monkeypatch.setattr("grokipedia_sdk.client.HAS_H2", has_h2)
+        client = Client(http2=True)
+        client._client
+        client._async_client
+        
+        assert mock_httpx.transport_class.call_args[1]['http2'] is expected
+        assert mock_httpx.async_transport_class.call_args[1]['http2'] is expected
+    
+    @patch('grokipedia_sdk.client.httpx.AsyncHTTPTransport')
+    @patch('grokipedia_sdk.client.httpx.HTTPTransport')
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_custom_connection_limits(self, mock_client_class, mock_async_client_class,
+                                      mock_transport_class, mock_async_transport_class):
+        """Test that max_connections and keepalive_expiry reach the client and transport"""
+        client = Client(max_connections=8, keepalive_expiry=30.0)
+        client._client
+        client._async_client
+        
+        limits = mock_client_class.call_args[1]['limits']
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 8
+        assert limits.keepalive_expiry == 30.0
+        assert mock_transport_class.call_args[1]['limits'] == limits
+        assert mock_async_transport_class.call_args[1]['limits'] == limits
 
 
 class TestClientContextManager:
@@ -200,17 +271,13 @@ class TestClientContextManager:
             assert client is not None
             assert hasattr(client, '_client')
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_context_manager_exit_closes_client(self, mock_client_class):
+    def test_context_manager_exit_closes_client(self, mock_httpx):
         """Test that exiting context manager closes HTTP client"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        
         with Client() as client:
             assert client._client is not None
         
         # Verify close was called
-        mock_client_instance.close.assert_called_once()
+        mock_httpx.client_class.return_value.close.assert_called_once()
     
     @patch('grokipedia_sdk.client.httpx.Client')
     def test_context_manager_exit_on_exception(self, mock_client_class):
@@ -220,6 +287,7 @@ class TestClientContextManager:
         
         try:
             with Client() as client:
+                client._client
                 raise ValueError("Test exception")
         except ValueError:
             pass
@@ -227,60 +295,48 @@ class TestClientContextManager:
         # Verify close was called even though exception occurred
         mock_client_instance.close.assert_called_once()
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_multiple_context_managers(self, mock_client_class):
+    def test_multiple_context_managers(self, mock_httpx):
         """Test using multiple context managers"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        
         with Client() as client1:
             with Client() as client2:
                 assert client1 is not client2
+                assert client1._client and client2._client
         
         # Both should be closed
-        assert mock_client_instance.close.call_count == 2
+        assert mock_httpx.client_class.return_value.close.call_count == 2
 
 
 class TestClientCleanup:
     """Test Client cleanup and resource management"""
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_close_closes_http_client(self, mock_client_class):
+    def test_close_closes_http_client(self, mock_httpx):
         """Test that close() closes HTTP client"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        
         client = Client()
         assert client._client is not None
         
         client.close()
         
-        mock_client_instance.close.assert_called_once()
+        mock_httpx.client_class.return_value.close.assert_called_once()
         assert client._client is None
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_close_idempotent(self, mock_client_class):
+    def test_close_idempotent(self, mock_httpx):
         """Test that close() can be called multiple times safely"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        
         client = Client()
+        client._client
         
         client.close()
         client.close()
         client.close()
         
         # Should only close once
-        assert mock_client_instance.close.call_count == 1
+        assert mock_httpx.client_class.return_value.close.call_count == 1
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_close_after_context_manager(self, mock_client_class):
+    def test_close_after_context_manager(self, mock_httpx):
         """Test that close() works after context manager"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_client_instance = mock_httpx.client_class.return_value
         
         with Client() as client:
-            pass
+            client._client
         
         # Already closed by context manager
         assert mock_client_instance.close.call_count == 1
@@ -289,74 +345,83 @@ class TestClientCleanup:
         client.close()
         assert mock_client_instance.close.call_count == 1
     
+    @patch('grokipedia_sdk.client.httpx.AsyncClient')
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_destructor_closes_client(self, mock_client_class):
-        """Test that __del__ closes client if not already closed"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+    def test_close_after_aclose_is_noop(self, mock_client_class, mock_async_client_class):
+        """Test that close() does nothing once aclose() has run"""
+        import asyncio
+        mock_async_client_class.return_value.aclose = AsyncMock()
+        
+        client = Client()
+        client._client
+        client._async_client
+        asyncio.run(client.aclose())
+        client.close()
         
+        assert mock_client_class.return_value.close.call_count == 1
+        assert mock_async_client_class.return_value.aclose.await_count == 1
+    
+    def test_destructor_closes_client(self, mock_httpx):
+        """Test that garbage collecting an open Client closes its HTTP client"""
         client = Client()
-        client._client = mock_client_instance
+        client._client
+        finalizer = client._finalizer
+        assert finalizer.alive
         
         # Delete client object
         del client
+        gc.collect()
         
         # Verify close was called
-        mock_client_instance.close.assert_called_once()
+        assert not finalizer.alive
+        mock_httpx.client_class.return_value.close.assert_called_once()
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_destructor_handles_already_closed(self, mock_client_class):
-        """Test that __del__ handles already-closed client gracefully"""
-        mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
-        
+    def test_destructor_handles_already_closed(self, mock_httpx):
+        """Test that an explicitly closed Client is not closed again on collection"""
         client = Client()
+        client._client
         client.close()  # Explicitly close
+        finalizer = client._finalizer
+        assert not finalizer.alive
         
         # Delete client object
         del client
+        gc.collect()
         
-        # Should not raise exception
+        mock_httpx.client_class.return_value.close.assert_called_once()
 
 
 class TestClientConfigurationDefaults:
     """Test default configuration values"""
     
-    def test_default_timeout_value(self):
+    def test_default_timeout_value(self, default_client):
         """Test default timeout is 30.0 seconds"""
-        client = Client()
-        assert client.timeout == 30.0
+        assert default_client.timeout == 30.0
     
-    def test_default_max_cache_size(self):
+    def test_default_max_cache_size(self, default_client):
         """Test default max_cache_size is 1000"""
-        client = Client()
-        assert client.max_cache_size == 1000
+        assert default_client.max_cache_size == 1000
     
-    def test_default_rate_limit(self):
+    def test_default_rate_limit(self, default_client):
         """Test default rate_limit is 1.0 seconds"""
-        client = Client()
-        assert client._rate_limit == 1.0
+        assert default_client._rate_limit == 1.0
     
-    def test_default_max_retries(self):
+    def test_default_max_retries(self, default_client):
         """Test default max_retries is 3"""
-        client = Client()
-        assert client.max_retries == 3
+        assert default_client.max_retries == 3
     
-    def test_default_verify(self):
+    def test_default_verify(self, default_client):
         """Test default verify is True"""
-        client = Client()
-        assert client._verify is True
+        assert default_client._verify is True
     
-    def test_default_cert_is_none(self):
+    def test_default_cert_is_none(self, default_client):
         """Test default cert is None"""
-        client = Client()
-        assert client._cert is None
+        assert default_client._cert is None
     
-    def test_default_user_agent_contains_sdk_name(self):
+    def test_default_user_agent_contains_sdk_name(self, default_client):
         """Test default User-Agent contains SDK name"""
-        client = Client()
-        assert "GrokipediaSDK" in client.user_agent
-        assert "Python SDK" in client.user_agent
+        assert _UA_RE.search(default_client.user_agent)
+        assert default_client.user_agent is DEFAULT_USER_AGENT
 
 
 class TestClientWithMockSlugIndex:
@@ -371,9 +436,9 @@ class TestClientWithMockSlugIndex:
         
         assert client._slug_index is mock_index
     
-    def test_client_slug_methods_use_mock_index(self):
-        """Test that slug methods use the provided mock index"""
-        from unittest.mock import Mock
+    @pytest.fixture
+    def mock_index(self):
+        """Mock SlugIndex with canned results for every slug method"""
         mock_index = Mock(spec=SlugIndex)
         mock_index.search.return_value = ['Article1', 'Article2']
         mock_index.find_best_match.return_value = 'Article1'
@@ -381,7 +446,10 @@ class TestClientWithMockSlugIndex:
         mock_index.list_by_prefix.return_value = ['Article1']
         mock_index.get_total_count.return_value = 100
         mock_index.random_slugs.return_value = ['Random1']
-        
+        return mock_index
+    
+    def test_client_slug_methods_use_mock_index(self, mock_index):
+        """Test that slug methods use the provided mock index"""
         client = Client(slug_index=mock_index)
         
         assert client.search_slug("test") == ['Article1', 'Article2']
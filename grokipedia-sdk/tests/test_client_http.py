@@ -4,6 +4,7 @@ import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock
 from grokipedia_sdk import Client, ArticleNotFound, RequestError
+from grokipedia_sdk.client import _parse_article_html
 from grokipedia_sdk.models import Article, ArticleSummary, Section
 import httpx
 
@@ -48,23 +49,31 @@ SAMPLE_SUMMARY_HTML = """
 """
 
 
+@pytest.fixture(scope="module")
+def sample_article():
+    """SAMPLE_ARTICLE_HTML parsed once for the whole module"""
+    return _parse_article_html(
+        SAMPLE_ARTICLE_HTML, "Joe_Biden", "https://test.com/page/Joe_Biden", full_content=True
+    )
+
+
+@pytest.fixture
+def skip_parse(monkeypatch, sample_article):
+    """Return the pre-parsed sample article instead of parsing, for tests of HTTP behavior"""
+    monkeypatch.setattr(
+        "grokipedia_sdk.client._parse_article_html", lambda *args, **kwargs: sample_article
+    )
+    return sample_article
+
+
 class TestClientHTTPMethods:
     """Test Client HTTP fetching methods"""
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_success(self, mock_client_class):
+    def test_get_article_success(self, mock_transport):
         """Test successful article fetch"""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
         
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
-        
-        client = Client(base_url="https://test.com", max_cache_size=10)
+        client = Client(base_url="https://test.com", max_cache_size=10, transport=transport)
         article = client.get_article("Joe_Biden")
         
         # Verify article was fetched and parsed
@@ -78,23 +87,91 @@ class TestClientHTTPMethods:
         assert article.metadata.fact_checked is not None
         
         # Verify HTTP request was made
-        mock_client_instance.get.assert_called_once()
-        call_args = mock_client_instance.get.call_args
-        assert call_args[0][0] == "https://test.com/page/Joe_Biden"
+        assert len(transport.requests) == 1
+        assert str(transport.requests[0].url) == "https://test.com/page/Joe_Biden"
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_summary_success(self, mock_client_class):
-        """Test successful summary fetch"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_SUMMARY_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+    def test_get_article_uses_cache_on_second_call(self, mock_transport):
+        """Test that repeat article, summary and section lookups reuse the cached article"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
         
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
+        client = Client(base_url="https://test.com", max_cache_size=10, transport=transport)
+        article = client.get_article("Joe_Biden")
         
-        client = Client(base_url="https://test.com")
+        assert client.get_article("Joe_Biden") is article
+        summary = client.get_summary("Joe_Biden")
+        section = client.get_section("Joe_Biden", "Early Life")
+        
+        assert len(transport.requests) == 1
+        assert isinstance(summary, ArticleSummary)
+        assert summary.title == article.title
+        assert summary.summary == article.summary
+        assert summary.table_of_contents == article.table_of_contents
+        assert section is not None and section.title == "Early Life"
+    
+    def test_get_article_304_uses_cache(self, mock_transport, monkeypatch):
+        """Test that refreshing sends the ETag and a 304 reuses the cached article without parsing"""
+        parse = Mock(wraps=_parse_article_html)
+        monkeypatch.setattr("grokipedia_sdk.client._parse_article_html", parse)
+        transport = mock_transport([
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML,
+                           headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+            httpx.Response(304),
+        ])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        article = client.get_article("Joe_Biden")
+        refreshed = client.get_article("Joe_Biden", refresh=True)
+        
+        assert refreshed is article
+        assert parse.call_count == 1
+        assert len(transport.requests) == 2
+        assert "If-None-Match" not in transport.requests[0].headers
+        assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+        assert transport.requests[1].headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    
+    def test_get_article_unsolicited_304_raises(self, mock_transport):
+        """Test that a 304 to a request without validators raises instead of returning None"""
+        transport = mock_transport([httpx.Response(304)])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        
+        with pytest.raises(RequestError, match="304"):
+            client.get_article("Joe_Biden")
+        with pytest.raises(RequestError, match="304"):
+            client.get_article("Joe_Biden", refresh=True)
+    
+    def test_get_article_refresh_replaces_changed_article(self, mock_transport):
+        """Test that a 200 reply to a refresh replaces the cached article and its ETag"""
+        transport = mock_transport([
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML, headers={"ETag": '"v1"'}),
+            httpx.Response(200, text=SAMPLE_SUMMARY_HTML, headers={"ETag": '"v2"'}),
+        ])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        article = client.get_article("Joe_Biden")
+        refreshed = client.get_article("Joe_Biden", refresh=True)
+        
+        assert refreshed is not article
+        assert client.get_article("Joe_Biden") is refreshed
+        assert client._cache_validators["Joe_Biden"] == {"If-None-Match": '"v2"'}
+    
+    def test_refresh_without_validators_refetches(self, mock_transport):
+        """Test that refreshing an article served without validators makes a plain GET"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        client.get_article("Joe_Biden")
+        client.get_article("Joe_Biden", refresh=True)
+        
+        assert len(transport.requests) == 2
+        assert "If-None-Match" not in transport.requests[1].headers
+        assert "Joe_Biden" not in client._cache_validators
+    
+    def test_get_summary_success(self, mock_transport):
+        """Test successful summary fetch"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_SUMMARY_HTML)])
+        
+        client = Client(base_url="https://test.com", transport=transport)
         summary = client.get_summary("Joe_Biden")
         
         assert isinstance(summary, ArticleSummary)
@@ -102,60 +179,72 @@ class TestClientHTTPMethods:
         assert summary.slug == "Joe_Biden"
         assert "summary" in summary.summary.lower()
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_section_success(self, mock_client_class):
+    def test_get_section_success(self, mock_transport):
         """Test successful section fetch"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
         
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
-        
-        client = Client(base_url="https://test.com")
+        client = Client(base_url="https://test.com", transport=transport)
         section = client.get_section("Joe_Biden", "Early Life")
         
         assert isinstance(section, Section)
         assert section.title == "Early Life"
         assert "Scranton" in section.content
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_section_not_found(self, mock_client_class):
+    def test_get_section_not_found(self, mock_transport):
         """Test get_section returns None when section doesn't exist"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
         
-        client = Client(base_url="https://test.com")
+        client = Client(base_url="https://test.com", transport=transport)
         section = client.get_section("Joe_Biden", "Nonexistent Section")
         
         assert section is None
+    
+    def test_user_agent_sent_with_requests(self, mock_transport):
+        """Test that requests carry the client's User-Agent header"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_SUMMARY_HTML)])
+        
+        client = Client(base_url="https://test.com", user_agent="TestAgent/1.0", transport=transport)
+        client.get_summary("Joe_Biden")
+        
+        assert transport.requests[0].headers["User-Agent"] == "TestAgent/1.0"
+    
+    def test_compressed_responses_negotiated_and_decoded(self, mock_transport):
+        """Test that httpx's Accept-Encoding is kept and gzip bodies are decoded transparently"""
+        import gzip
+        
+        transport = mock_transport([httpx.Response(
+            200, content=gzip.compress(SAMPLE_SUMMARY_HTML.encode()),
+            headers={"Content-Encoding": "gzip"}
+        )])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        summary = client.get_summary("Joe_Biden")
+        
+        accepted = {name.strip() for name in transport.requests[0].headers["Accept-Encoding"].split(",")}
+        assert {"gzip", "deflate"} <= accepted
+        assert summary.title == "Joe Biden"
+    
+    def test_user_agent_change_applies_to_later_requests(self, mock_transport):
+        """Test that assigning user_agent rebuilds the shared request headers"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_SUMMARY_HTML)])
+        
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        client.get_summary("Joe_Biden")
+        client.user_agent = "Changed/2.0"
+        client.get_summary("Joe_Biden")
+        
+        assert "GrokipediaSDK" in transport.requests[0].headers["User-Agent"]
+        assert transport.requests[1].headers["User-Agent"] == "Changed/2.0"
 
 
 class TestClientErrorHandling:
     """Test Client error handling and HTTP status codes"""
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_404_raises_article_not_found(self, mock_client_class):
+    def test_get_article_404_raises_article_not_found(self, mock_transport):
         """Test that 404 raises ArticleNotFound"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Not Found", request=Mock(), response=mock_response
-        )
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
+        transport = mock_transport([httpx.Response(404)])
         
-        client = Client(base_url="https://test.com", max_retries=0)
+        client = Client(base_url="https://test.com", max_retries=0, transport=transport)
         
         with pytest.raises(ArticleNotFound) as exc_info:
             client.get_article("Nonexistent_Article")
@@ -163,108 +252,99 @@ class TestClientErrorHandling:
         assert "Nonexistent_Article" in str(exc_info.value)
         assert "404" in str(exc_info.value) or "not found" in str(exc_info.value).lower()
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_429_rate_limit(self, mock_client_class):
+    @pytest.mark.usefixtures("skip_parse")
+    def test_get_article_429_rate_limit(self, mock_transport):
         """Test that 429 rate limit error retries"""
-        mock_response_429 = Mock()
-        mock_response_429.status_code = 429
-        mock_response_429.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Rate Limited", request=Mock(), response=mock_response_429
-        )
+        transport = mock_transport([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML),
+        ])
         
-        mock_response_200 = Mock()
-        mock_response_200.text = SAMPLE_ARTICLE_HTML
-        mock_response_200.status_code = 200
-        mock_response_200.raise_for_status = Mock()
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = [mock_response_429, mock_response_200]
-        mock_client_class.return_value = mock_client_instance
-        
-        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0, transport=transport)
         
         article = client.get_article("Joe_Biden")
         
         # Should retry and eventually succeed
         assert isinstance(article, Article)
-        assert mock_client_instance.get.call_count == 2
+        assert len(transport.requests) == 2
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_500_server_error_retries(self, mock_client_class):
+    @pytest.mark.usefixtures("skip_parse")
+    def test_get_article_500_server_error_retries(self, mock_transport):
         """Test that 500 server errors retry"""
-        mock_response_500 = Mock()
-        mock_response_500.status_code = 500
-        mock_response_500.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Internal Server Error", request=Mock(), response=mock_response_500
-        )
-        
-        mock_response_200 = Mock()
-        mock_response_200.text = SAMPLE_ARTICLE_HTML
-        mock_response_200.status_code = 200
-        mock_response_200.raise_for_status = Mock()
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = [mock_response_500, mock_response_200]
-        mock_client_class.return_value = mock_client_instance
+        transport = mock_transport([
+            httpx.Response(500),
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML),
+        ])
         
-        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0,
+                        backoff_base=0, backoff_cap=0, transport=transport)
         
         article = client.get_article("Joe_Biden")
         
         assert isinstance(article, Article)
-        assert mock_client_instance.get.call_count == 2
+        assert len(transport.requests) == 2
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_500_max_retries_exceeded(self, mock_client_class):
+    @pytest.mark.usefixtures("skip_parse")
+    @pytest.mark.parametrize("status_code", [408, 502, 503, 504])
+    def test_get_article_retryable_statuses(self, mock_transport, status_code):
+        """Test that 408 and other 5xx statuses are retried"""
+        transport = mock_transport([
+            httpx.Response(status_code),
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML),
+        ])
+        
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0,
+                        backoff_base=0, backoff_cap=0, transport=transport)
+        
+        assert isinstance(client.get_article("Joe_Biden"), Article)
+        assert len(transport.requests) == 2
+    
+    def test_get_article_500_max_retries_exceeded(self, mock_transport):
         """Test that RequestError is raised after max retries"""
-        mock_response_500 = Mock()
-        mock_response_500.status_code = 500
-        mock_response_500.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Internal Server Error", request=Mock(), response=mock_response_500
-        )
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response_500
-        mock_client_class.return_value = mock_client_instance
+        transport = mock_transport([httpx.Response(500)])
         
-        client = Client(base_url="https://test.com", max_retries=2, rate_limit=0)
+        client = Client(base_url="https://test.com", max_retries=2, rate_limit=0,
+                        backoff_base=0, backoff_cap=0, transport=transport)
         
         with pytest.raises(RequestError) as exc_info:
             client.get_article("Joe_Biden")
         
         assert "500" in str(exc_info.value) or "server error" in str(exc_info.value).lower()
         # Should have attempted max_retries + 1 times
-        assert mock_client_instance.get.call_count == 3
+        assert len(transport.requests) == 3
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_connection_error_retries(self, mock_client_class):
-        """Test that connection errors retry"""
-        mock_response_200 = Mock()
-        mock_response_200.text = SAMPLE_ARTICLE_HTML
-        mock_response_200.status_code = 200
-        mock_response_200.raise_for_status = Mock()
-        
+    def test_get_article_connection_error_not_retried_by_client(self, mock_client_class):
+        """Test that connection errors are left to the transport's retries"""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = [
-            httpx.ConnectError("Connection failed"),
-            mock_response_200
-        ]
+        mock_client_instance.get.side_effect = httpx.ConnectError("Connection failed")
         mock_client_class.return_value = mock_client_instance
         
         client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
         
-        article = client.get_article("Joe_Biden")
+        with pytest.raises(RequestError) as exc_info:
+            client.get_article("Joe_Biden")
         
-        assert isinstance(article, Article)
-        assert mock_client_instance.get.call_count == 2
+        assert "connect" in str(exc_info.value).lower()
+        assert mock_client_instance.get.call_count == 1
+    
+    @patch('grokipedia_sdk.client.httpx.AsyncHTTPTransport')
+    @patch('grokipedia_sdk.client.httpx.HTTPTransport')
+    def test_transport_retries_connection_errors(self, mock_transport_class, mock_async_transport_class):
+        """Test that the httpx transports are built with max_retries"""
+        client = Client(base_url="https://test.com", max_retries=4, verify=False)
+        client._client
+        client._async_client
+        
+        assert mock_transport_class.call_args[1]['retries'] == 4
+        assert mock_transport_class.call_args[1]['verify'] is False
+        assert mock_async_transport_class.call_args[1]['retries'] == 4
     
+    @pytest.mark.usefixtures("skip_parse")
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_timeout_retries(self, mock_client_class):
+    def test_get_article_timeout_retries(self, mock_client_class, fake_response):
         """Test that timeout errors retry"""
-        mock_response_200 = Mock()
-        mock_response_200.text = SAMPLE_ARTICLE_HTML
-        mock_response_200.status_code = 200
-        mock_response_200.raise_for_status = Mock()
+        mock_response_200 = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.side_effect = [
@@ -280,67 +360,81 @@ class TestClientErrorHandling:
         assert isinstance(article, Article)
         assert mock_client_instance.get.call_count == 2
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_400_client_error_no_retry(self, mock_client_class):
+    def test_get_article_400_client_error_no_retry(self, mock_transport):
         """Test that 400 client errors don't retry"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Bad Request", request=Mock(), response=mock_response
-        )
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
+        transport = mock_transport([httpx.Response(400)])
         
-        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0, transport=transport)
         
         with pytest.raises(RequestError) as exc_info:
             client.get_article("Joe_Biden")
         
         assert "400" in str(exc_info.value) or "error" in str(exc_info.value).lower()
         # Should not retry for 400 errors
-        assert mock_client_instance.get.call_count == 1
+        assert len(transport.requests) == 1
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    def test_get_article_403_forbidden_no_retry(self, mock_client_class):
+    def test_get_article_403_forbidden_no_retry(self, mock_transport):
         """Test that 403 forbidden errors don't retry"""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Forbidden", request=Mock(), response=mock_response
-        )
+        transport = mock_transport([httpx.Response(403)])
         
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
-        
-        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0, transport=transport)
         
         with pytest.raises(RequestError) as exc_info:
             client.get_article("Joe_Biden")
         
         assert "403" in str(exc_info.value) or "error" in str(exc_info.value).lower()
-        assert mock_client_instance.get.call_count == 1
+        assert len(transport.requests) == 1
+
+
+class TestClientBatchRequests:
+    """Test synchronous batched article fetching"""
+    
+    def test_get_articles_preserves_order(self, mock_transport):
+        """Test that get_articles fetches every slug and returns them in input order"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        
+        slugs = [f"Article{i}" for i in range(10)]
+        articles = client.get_articles(slugs, max_concurrency=4)
+        
+        assert [article.slug for article in articles] == slugs
+        assert len(transport.requests) == 10
+    
+    def test_get_articles_return_exceptions(self, mock_transport):
+        """Test that failures are returned in place when return_exceptions=True"""
+        transport = mock_transport(
+            lambda request: httpx.Response(404) if request.url.path.endswith("Missing")
+            else httpx.Response(200, text=SAMPLE_ARTICLE_HTML)
+        )
+        client = Client(base_url="https://test.com", rate_limit=0, transport=transport)
+        
+        results = client.get_articles(["Joe_Biden", "Missing"], return_exceptions=True)
+        
+        assert isinstance(results[0], Article)
+        assert isinstance(results[1], ArticleNotFound)
+        
+        with pytest.raises(ArticleNotFound):
+            client.get_articles(["Joe_Biden", "Missing"])
+    
+    def test_get_articles_empty_and_invalid_concurrency(self):
+        """Test get_articles with no slugs and with max_concurrency < 1"""
+        client = Client(base_url="https://test.com")
+        
+        assert client.get_articles([]) == []
+        with pytest.raises(ValueError):
+            client.get_articles(["Joe_Biden"], max_concurrency=0)
 
 
+@pytest.mark.usefixtures("skip_parse")
 class TestClientRetryLogic:
-    """Test retry logic with exponential backoff"""
+    """Test retry logic with jittered exponential backoff"""
     
     @patch('grokipedia_sdk.client.httpx.Client')
     @patch('grokipedia_sdk.client.time.sleep')
-    def test_exponential_backoff_on_retries(self, mock_sleep, mock_client_class):
-        """Test that retries use exponential backoff"""
-        mock_response_500 = Mock()
-        mock_response_500.status_code = 500
-        mock_response_500.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Internal Server Error", request=Mock(), response=mock_response_500
-        )
-        
-        mock_response_200 = Mock()
-        mock_response_200.text = SAMPLE_ARTICLE_HTML
-        mock_response_200.status_code = 200
-        mock_response_200.raise_for_status = Mock()
+    def test_exponential_backoff_on_retries(self, mock_sleep, mock_client_class, fake_response):
+        """Test that retries use bounded decorrelated-jitter backoff"""
+        mock_response_500 = fake_response(500)
+        mock_response_200 = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.side_effect = [
@@ -350,25 +444,58 @@ class TestClientRetryLogic:
         ]
         mock_client_class.return_value = mock_client_instance
         
-        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0)
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0,
+                        backoff_base=0.5, backoff_cap=30.0)
         
         article = client.get_article("Joe_Biden")
         
         assert isinstance(article, Article)
-        # Should have slept between retries (exponential backoff: 2^0, 2^1)
-        assert mock_sleep.call_count >= 2
+        # Should have slept once between each retry
+        assert mock_sleep.call_count == 2
         sleep_values = [call[0][0] for call in mock_sleep.call_args_list]
-        # Check that sleep times follow exponential pattern (approximately)
-        assert sleep_values[0] <= sleep_values[1] or sleep_values[0] == sleep_values[1]
+        # Each delay stays within [base, cap] and at most triples the previous one
+        previous = 0.5
+        for value in sleep_values:
+            assert 0.5 <= value <= 30.0
+            assert value <= previous * 3
+            previous = value
+    
+    @pytest.mark.parametrize("retry_after,expected", [("2", 2.0), ("120", 30.0)])
+    def test_rate_limit_honors_retry_after(self, fake_clock, mock_transport, retry_after, expected):
+        """Test that a 429 waits for the Retry-After header, capped at backoff_cap"""
+        transport = mock_transport([
+            httpx.Response(429, headers={"Retry-After": retry_after}),
+            httpx.Response(200, text=SAMPLE_ARTICLE_HTML),
+        ])
+        
+        client = Client(base_url="https://test.com", max_retries=3, rate_limit=0,
+                        backoff_cap=30.0, transport=transport)
+        
+        client.get_article("Joe_Biden")
+        
+        assert fake_clock.sleeps == [expected]
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for delta-seconds, HTTP-dates, and junk"""
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+        from grokipedia_sdk.client import _parse_retry_after
+        
+        assert _parse_retry_after("5") == 5.0
+        assert _parse_retry_after("-3") == 0.0
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("soon") is None
+        
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 55 <= delay <= 60
+        past = format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)
+        assert _parse_retry_after(past) == 0.0
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_no_retries_when_max_retries_zero(self, mock_client_class):
+    def test_no_retries_when_max_retries_zero(self, mock_client_class, fake_response):
         """Test that no retries occur when max_retries=0"""
-        mock_response_500 = Mock()
-        mock_response_500.status_code = 500
-        mock_response_500.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Internal Server Error", request=Mock(), response=mock_response_500
-        )
+        mock_response_500 = fake_response(500)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response_500
@@ -383,88 +510,76 @@ class TestClientRetryLogic:
         assert mock_client_instance.get.call_count == 1
 
 
+@pytest.mark.usefixtures("skip_parse")
 class TestClientRateLimiting:
     """Test rate limiting functionality"""
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    @patch('grokipedia_sdk.client.time.sleep')
-    @patch('grokipedia_sdk.client.time.time')
-    def test_rate_limiting_enforced(self, mock_time, mock_sleep, mock_client_class):
+    def test_rate_limiting_enforced(self, fake_clock, mock_transport):
         """Test that rate limiting delays requests"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
-        
-        # Simulate time progression - return increasing values
-        call_count = [0]
-        def time_side_effect():
-            result = call_count[0] * 0.1  # Start at 0.0, then 0.1, 0.2, etc.
-            call_count[0] += 1
-            return result
-        
-        mock_time.side_effect = time_side_effect
-        
-        client = Client(base_url="https://test.com", rate_limit=1.0, max_retries=0)
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        client = Client(base_url="https://test.com", rate_limit=1.0, max_retries=0, transport=transport)
         
         # First request (no delay expected)
         client.get_article("Article1")
+        assert fake_clock.sleeps == []
         
-        # Second request immediately after (should delay because elapsed < rate_limit)
-        # time.time() will be called multiple times, so we need many values
-        call_count[0] = 0  # Reset to simulate immediate second call
-        
-        # Mock time to return same value twice (simulating immediate second call)
-        def time_side_effect_immediate():
-            # First call returns 0.0, subsequent calls also return 0.0 (immediate)
-            return 0.0
-        mock_time.side_effect = time_side_effect_immediate
-        
+        # Second request at the same instant waits a full interval
         client.get_article("Article2")
+        assert fake_clock.sleeps == [1.0]
         
-        # Verify sleep was called for rate limiting
-        assert mock_sleep.called
+        # Once the interval has passed, no wait is needed
+        fake_clock.advance(1.0)
+        client.get_article("Article3")
+        assert fake_clock.sleeps == [1.0]
     
-    @patch('grokipedia_sdk.client.httpx.Client')
-    @patch('grokipedia_sdk.client.time.sleep')
-    def test_rate_limiting_disabled_when_zero(self, mock_sleep, mock_client_class):
+    def test_rate_limit_token_bucket(self, fake_clock):
+        """Test token refill, burst capacity, and queueing of back-to-back reservations"""
+        client = Client(base_url="https://test.com", rate_limit=2.0, rate_limit_burst=3)
+        
+        # A full bucket lets a burst through without waiting
+        assert [client._reserve_request_slot() for _ in range(3)] == [0.0, 0.0, 0.0]
+        # Then callers queue one interval apart
+        assert client._reserve_request_slot() == 2.0
+        assert client._reserve_request_slot() == 4.0
+        
+        # Idle time refills the bucket, but never beyond the burst size
+        fake_clock.advance(100.0)
+        assert [client._reserve_request_slot() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert client._reserve_request_slot() == 2.0
+    
+    @pytest.mark.parametrize("burst", [1, 3])
+    def test_rate_limit_paces_sequential_requests(self, fake_clock, mock_transport, burst):
+        """Test that N back-to-back requests take (N - burst) intervals in total"""
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        client = Client(base_url="https://test.com", rate_limit=0.5, rate_limit_burst=burst,
+                        max_retries=0, transport=transport)
+        
+        for i in range(10):
+            client.get_article(f"Article{i}")
+        
+        assert fake_clock.now == pytest.approx((10 - burst) * 0.5)
+        assert len(transport.requests) == 10
+    
+    def test_rate_limiting_disabled_when_zero(self, fake_clock, mock_transport):
         """Test that rate limiting is disabled when rate_limit=0"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value = mock_client_instance
-        
-        client = Client(base_url="https://test.com", rate_limit=0, max_retries=0)
+        transport = mock_transport([httpx.Response(200, text=SAMPLE_ARTICLE_HTML)])
+        client = Client(base_url="https://test.com", rate_limit=0, max_retries=0, transport=transport)
         
         client.get_article("Article1")
         client.get_article("Article2")
         
-        # Should not sleep for rate limiting (only for retries if any)
-        # Mock sleep to check if it was called for rate limiting
-        calls_for_rate_limit = [call for call in mock_sleep.call_args_list 
-                                if len(call[0]) > 0 and call[0][0] > 0]
         # With rate_limit=0, no rate limiting sleep should occur
-        assert len(calls_for_rate_limit) == 0
+        assert fake_clock.sleeps == []
 
 
+@pytest.mark.usefixtures("skip_parse")
 class TestClientURLConstruction:
     """Test URL construction and slug encoding"""
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_url_construction_with_base_url(self, mock_client_class):
+    def test_url_construction_with_base_url(self, mock_client_class, fake_response):
         """Test that URLs are constructed correctly"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -477,12 +592,26 @@ class TestClientURLConstruction:
         assert call_args[0][0] == "https://example.com/api/page/Test_Article"
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_url_construction_with_special_characters(self, mock_client_class):
+    def test_url_construction_after_base_url_change(self, mock_client_class, fake_response):
+        """Test that reassigning base_url is reflected in request URLs"""
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
+        
+        mock_client_instance = Mock()
+        mock_client_instance.get.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+        
+        client = Client(base_url="https://example.com")
+        client.base_url = "https://example.com/my%20wiki/"
+        client.get_article("Test_Article")
+        
+        call_args = mock_client_instance.get.call_args
+        assert client.base_url == "https://example.com/my%20wiki"
+        assert call_args[0][0] == "https://example.com/my%20wiki/page/Test_Article"
+    
+    @patch('grokipedia_sdk.client.httpx.Client')
+    def test_url_construction_with_special_characters(self, mock_client_class, fake_response):
         """Test that special characters in slugs are URL encoded"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -498,16 +627,14 @@ class TestClientURLConstruction:
         assert "Article%20Name" in url or "Article+Name" in url
 
 
+@pytest.mark.usefixtures("skip_parse")
 class TestClientUserAgent:
     """Test User-Agent header handling"""
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_default_user_agent(self, mock_client_class):
+    def test_default_user_agent(self, mock_client_class, fake_response):
         """Test that default User-Agent is set"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -522,12 +649,9 @@ class TestClientUserAgent:
         assert 'GrokipediaSDK' in headers['User-Agent']
     
     @patch('grokipedia_sdk.client.httpx.Client')
-    def test_custom_user_agent(self, mock_client_class):
+    def test_custom_user_agent(self, mock_client_class, fake_response):
         """Test that custom User-Agent can be set"""
-        mock_response = Mock()
-        mock_response.text = SAMPLE_ARTICLE_HTML
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+        mock_response = fake_response(200, SAMPLE_ARTICLE_HTML)
         
         mock_client_instance = Mock()
         mock_client_instance.get.return_value = mock_response
@@ -1,13 +1,19 @@
 """Tests for dependency injection of SlugIndex into Client"""
 
+import bisect
+import random
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import patch
 from grokipedia_sdk import Client, SlugIndex
 
 
 class MockSlugIndex:
     """Mock implementation of SlugIndex for testing"""
     
+    __slots__ = (
+        "articles", "_lower_pairs", "_sorted_lower", "_sorted_orig", "_slug_set", "_slugs", "_rng",
+    )
+    
     def __init__(self, articles=None):
         """
         Initialize mock slug index with optional predefined articles.
@@ -26,13 +32,23 @@ class MockSlugIndex:
             self.articles = {slug.replace('_', ' '): slug for slug in articles}
         else:
             self.articles = articles
+        
+        # Lowercase names once so searches don't re-lower every name per query
+        self._lower_pairs = [(name.lower(), slug) for name, slug in self.articles.items()]
+        # Slugs sorted case-insensitively, so prefix listing can bisect to the first match
+        sorted_pairs = sorted((slug.lower(), slug) for slug in self.articles.values())
+        self._sorted_lower = [slug_lower for slug_lower, _ in sorted_pairs]
+        self._sorted_orig = [slug for _, slug in sorted_pairs]
+        self._slug_set = frozenset(self.articles.values())
+        self._slugs = tuple(self.articles.values())
+        self._rng = random.Random()
     
     def search(self, query, limit=10, fuzzy=True):
         """Search for matching slugs"""
         query_lower = query.lower()
         matches = []
-        for name, slug in self.articles.items():
-            if query_lower in name.lower():
+        for name_lower, slug in self._lower_pairs:
+            if query_lower in name_lower:
                 matches.append(slug)
                 if len(matches) >= limit:
                     break
@@ -45,16 +61,20 @@ class MockSlugIndex:
     
     def exists(self, slug):
         """Check if slug exists"""
-        return slug in self.articles.values()
+        return slug in self._slug_set
     
     def list_by_prefix(self, prefix="", limit=100):
         """List articles by prefix"""
+        prefix_lower = prefix.lower()
         matches = []
-        for slug in self.articles.values():
-            if slug.lower().startswith(prefix.lower()):
-                matches.append(slug)
-                if len(matches) >= limit:
-                    break
+        i = bisect.bisect_left(self._sorted_lower, prefix_lower)
+        while (
+            i < len(self._sorted_lower)
+            and len(matches) < limit
+            and self._sorted_lower[i].startswith(prefix_lower)
+        ):
+            matches.append(self._sorted_orig[i])
+            i += 1
         return matches
     
     def get_total_count(self):
@@ -63,9 +83,46 @@ class MockSlugIndex:
     
     def random_slugs(self, count=10):
         """Get random slugs"""
-        import random
-        slugs = list(self.articles.values())
-        return random.sample(slugs, min(count, len(slugs)))
+        return self._rng.sample(self._slugs, min(count, len(self._slugs)))
+
+
+class StubSlugIndex:
+    """Hand-rolled SlugIndex double that returns canned values and records calls"""
+    
+    __slots__ = ("returns", "calls")
+    
+    def __init__(self, **returns):
+        """
+        Initialize the stub with the value each SlugIndex method should return.
+        
+        Args:
+            **returns: Return values keyed by method name; unlisted methods return None
+        """
+        self.returns = returns
+        self.calls = []
+    
+    def _record(self, method, args, kwargs):
+        """Record a call as (method, args, kwargs) and return its canned value"""
+        self.calls.append((method, args, kwargs))
+        return self.returns.get(method)
+    
+    def search(self, *args, **kwargs):
+        return self._record('search', args, kwargs)
+    
+    def find_best_match(self, *args, **kwargs):
+        return self._record('find_best_match', args, kwargs)
+    
+    def exists(self, *args, **kwargs):
+        return self._record('exists', args, kwargs)
+    
+    def list_by_prefix(self, *args, **kwargs):
+        return self._record('list_by_prefix', args, kwargs)
+    
+    def get_total_count(self, *args, **kwargs):
+        return self._record('get_total_count', args, kwargs)
+    
+    def random_slugs(self, *args, **kwargs):
+        return self._record('random_slugs', args, kwargs)
 
 
 class TestClientDependencyInjection:
@@ -78,6 +135,14 @@ class TestClientDependencyInjection:
         assert client._slug_index is not None
         assert isinstance(client._slug_index, SlugIndex)
     
+    def test_client_construction_does_not_load_slug_index(self):
+        """Test that the sitemap is only read when a slug-index method is called"""
+        with patch.object(SlugIndex, 'load') as mock_load:
+            Client()
+            Client(base_url="https://test.com")
+        
+        mock_load.assert_not_called()
+    
     def test_client_with_custom_slug_index(self):
         """Test that Client accepts custom SlugIndex"""
         mock_index = MockSlugIndex()
@@ -144,7 +209,8 @@ class TestClientDependencyInjection:
         articles = client.get_random_articles(count=2)
         
         assert len(articles) == 2
-        assert all(article in list(mock_index.articles.values()) for article in articles)
+        known = set(mock_index.articles.values())
+        assert all(article in known for article in articles)
 
 
 class TestClientWithMockSlugIndex:
@@ -152,75 +218,69 @@ class TestClientWithMockSlugIndex:
     
     def test_client_initialization_with_mock(self):
         """Test Client initializes properly with mock SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
+        mock_index = StubSlugIndex()
         client = Client(slug_index=mock_index)
         
         assert client._slug_index is mock_index
     
     def test_search_slug_with_mock(self):
         """Test search_slug delegates to injected SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
-        mock_index.search.return_value = ['Article1', 'Article2']
+        mock_index = StubSlugIndex(search=['Article1', 'Article2'])
         
         client = Client(slug_index=mock_index)
         result = client.search_slug("test", limit=5, fuzzy=True)
         
-        mock_index.search.assert_called_once_with("test", limit=5, fuzzy=True)
+        assert mock_index.calls == [('search', ("test",), {'limit': 5, 'fuzzy': True})]
         assert result == ['Article1', 'Article2']
     
     def test_find_slug_with_mock(self):
         """Test find_slug delegates to injected SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
-        mock_index.find_best_match.return_value = 'Best_Match'
+        mock_index = StubSlugIndex(find_best_match='Best_Match')
         
         client = Client(slug_index=mock_index)
         result = client.find_slug("query")
         
-        mock_index.find_best_match.assert_called_once_with("query")
+        assert mock_index.calls == [('find_best_match', ("query",), {})]
         assert result == 'Best_Match'
     
     def test_slug_exists_with_mock(self):
         """Test slug_exists delegates to injected SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
-        mock_index.exists.return_value = True
+        mock_index = StubSlugIndex(exists=True)
         
         client = Client(slug_index=mock_index)
         result = client.slug_exists("Some_Slug")
         
-        mock_index.exists.assert_called_once_with("Some_Slug")
+        assert mock_index.calls == [('exists', ("Some_Slug",), {})]
         assert result is True
     
     def test_list_available_articles_with_mock(self):
         """Test list_available_articles delegates to injected SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
-        mock_index.list_by_prefix.return_value = ['Article1', 'Article2']
+        mock_index = StubSlugIndex(list_by_prefix=['Article1', 'Article2'])
         
         client = Client(slug_index=mock_index)
         result = client.list_available_articles(prefix="A", limit=50)
         
-        mock_index.list_by_prefix.assert_called_once_with(prefix="A", limit=50)
+        assert mock_index.calls == [('list_by_prefix', (), {'prefix': "A", 'limit': 50})]
         assert result == ['Article1', 'Article2']
     
     def test_get_total_article_count_with_mock(self):
         """Test get_total_article_count delegates to injected SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
-        mock_index.get_total_count.return_value = 1000
+        mock_index = StubSlugIndex(get_total_count=1000)
         
         client = Client(slug_index=mock_index)
         result = client.get_total_article_count()
         
-        mock_index.get_total_count.assert_called_once()
+        assert mock_index.calls == [('get_total_count', (), {})]
         assert result == 1000
     
     def test_get_random_articles_with_mock(self):
         """Test get_random_articles delegates to injected SlugIndex"""
-        mock_index = Mock(spec=SlugIndex)
-        mock_index.random_slugs.return_value = ['Random1', 'Random2', 'Random3']
+        mock_index = StubSlugIndex(random_slugs=['Random1', 'Random2', 'Random3'])
         
         client = Client(slug_index=mock_index)
         result = client.get_random_articles(count=3)
         
-        mock_index.random_slugs.assert_called_once_with(count=3)
+        assert mock_index.calls == [('random_slugs', (), {'count': 3})]
         assert result == ['Random1', 'Random2', 'Random3']
 
 
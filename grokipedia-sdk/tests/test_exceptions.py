@@ -7,28 +7,32 @@ from grokipedia_sdk.exceptions import (
     RequestError
 )
 
+# Every SDK exception class, with a message to raise it with
+SDK_EXCEPTIONS = (
+    (GrokipediaError, "Base error"),
+    (ArticleNotFound, "Article not found"),
+    (RequestError, "Request failed"),
+)
+
+# (subclass, superclass, whether sub should inherit from sup)
+HIERARCHY = [
+    (GrokipediaError, Exception, True),
+    (ArticleNotFound, GrokipediaError, True),
+    (ArticleNotFound, Exception, True),
+    (RequestError, GrokipediaError, True),
+    (RequestError, Exception, True),
+    (ArticleNotFound, RequestError, False),
+    (RequestError, ArticleNotFound, False),
+]
+
 
 class TestExceptionHierarchy:
     """Test exception inheritance hierarchy"""
     
-    def test_grokipedia_error_is_base_exception(self):
-        """Test that GrokipediaError is base exception"""
-        assert issubclass(GrokipediaError, Exception)
-    
-    def test_article_not_found_inherits_from_grokipedia_error(self):
-        """Test that ArticleNotFound inherits from GrokipediaError"""
-        assert issubclass(ArticleNotFound, GrokipediaError)
-        assert issubclass(ArticleNotFound, Exception)
-    
-    def test_request_error_inherits_from_grokipedia_error(self):
-        """Test that RequestError inherits from GrokipediaError"""
-        assert issubclass(RequestError, GrokipediaError)
-        assert issubclass(RequestError, Exception)
-    
-    def test_exceptions_are_not_siblings(self):
-        """Test that ArticleNotFound and RequestError are not related"""
-        assert not issubclass(ArticleNotFound, RequestError)
-        assert not issubclass(RequestError, ArticleNotFound)
+    @pytest.mark.parametrize("sub, sup, expected", HIERARCHY)
+    def test_hierarchy(self, sub, sup, expected):
+        """Test each subclass relationship in the SDK exception hierarchy"""
+        assert issubclass(sub, sup) is expected
 
 
 class TestGrokipediaError:
@@ -47,10 +51,8 @@ class TestGrokipediaError:
     
     def test_grokipedia_error_can_be_caught_by_exception(self):
         """Test that GrokipediaError can be caught by Exception"""
-        try:
+        with pytest.raises(Exception):
             raise GrokipediaError("Test")
-        except Exception as e:
-            assert isinstance(e, GrokipediaError)
 
 
 class TestArticleNotFound:
@@ -69,26 +71,19 @@ class TestArticleNotFound:
     
     def test_article_not_found_can_be_caught_by_grokipedia_error(self):
         """Test that ArticleNotFound can be caught by GrokipediaError"""
-        try:
+        with pytest.raises(GrokipediaError):
             raise ArticleNotFound("Not found")
-        except GrokipediaError as e:
-            assert isinstance(e, ArticleNotFound)
     
     def test_article_not_found_can_be_caught_by_exception(self):
         """Test that ArticleNotFound can be caught by Exception"""
-        try:
+        with pytest.raises(Exception):
             raise ArticleNotFound("Not found")
-        except Exception as e:
-            assert isinstance(e, ArticleNotFound)
     
     def test_article_not_found_not_caught_by_request_error(self):
         """Test that ArticleNotFound is NOT caught by RequestError"""
-        try:
+        assert not issubclass(ArticleNotFound, RequestError)
+        with pytest.raises(ArticleNotFound):
             raise ArticleNotFound("Not found")
-        except RequestError:
-            pytest.fail("ArticleNotFound should not be caught by RequestError")
-        except ArticleNotFound:
-            pass  # Expected
 
 
 class TestRequestError:
@@ -107,105 +102,63 @@ class TestRequestError:
     
     def test_request_error_can_be_caught_by_grokipedia_error(self):
         """Test that RequestError can be caught by GrokipediaError"""
-        try:
+        with pytest.raises(GrokipediaError):
             raise RequestError("Request failed")
-        except GrokipediaError as e:
-            assert isinstance(e, RequestError)
     
     def test_request_error_can_be_caught_by_exception(self):
         """Test that RequestError can be caught by Exception"""
-        try:
+        with pytest.raises(Exception):
             raise RequestError("Request failed")
-        except Exception as e:
-            assert isinstance(e, RequestError)
     
     def test_request_error_not_caught_by_article_not_found(self):
         """Test that RequestError is NOT caught by ArticleNotFound"""
-        try:
+        assert not issubclass(RequestError, ArticleNotFound)
+        with pytest.raises(RequestError):
             raise RequestError("Request failed")
-        except ArticleNotFound:
-            pytest.fail("RequestError should not be caught by ArticleNotFound")
-        except RequestError:
-            pass  # Expected
 
 
 class TestExceptionUsage:
     """Test exception usage patterns"""
     
-    def test_catching_base_exception_catches_all(self):
-        """Test that catching GrokipediaError catches all SDK exceptions"""
-        exceptions = [
-            GrokipediaError("Base error"),
-            ArticleNotFound("Article not found"),
-            RequestError("Request failed"),
-        ]
-        
-        for exc in exceptions:
-            try:
-                raise exc
-            except GrokipediaError:
-                pass  # Should catch all
-            except Exception:
-                pytest.fail(f"GrokipediaError should catch {type(exc)}")
-    
-    def test_catching_exception_catches_all(self):
-        """Test that catching Exception catches all SDK exceptions"""
-        exceptions = [
-            GrokipediaError("Base error"),
-            ArticleNotFound("Article not found"),
-            RequestError("Request failed"),
-        ]
-        
-        for exc in exceptions:
-            try:
-                raise exc
-            except Exception:
-                pass  # Should catch all
+    @pytest.mark.parametrize("catch_cls", [GrokipediaError, Exception])
+    @pytest.mark.parametrize("exc_cls, msg", SDK_EXCEPTIONS)
+    def test_catching_base_class_catches_all(self, catch_cls, exc_cls, msg):
+        """Test that catching GrokipediaError or Exception catches all SDK exceptions"""
+        with pytest.raises(catch_cls):
+            raise exc_cls(msg)
     
     def test_specific_exception_catching(self):
         """Test catching specific exceptions"""
-        # Test catching ArticleNotFound specifically
-        try:
+        with pytest.raises(ArticleNotFound) as exc_info:
             raise ArticleNotFound("Not found")
-        except ArticleNotFound:
-            pass  # Should catch
-        except RequestError:
-            pytest.fail("Should not catch ArticleNotFound")
-        except GrokipediaError:
-            pytest.fail("Should catch ArticleNotFound specifically first")
+        
+        assert exc_info.type is ArticleNotFound
     
     def test_exception_chaining(self):
         """Test exception chaining"""
-        try:
+        with pytest.raises(ArticleNotFound, match="Outer error") as exc_info:
             try:
                 raise RequestError("Inner error")
             except RequestError as e:
                 raise ArticleNotFound("Outer error") from e
-        except ArticleNotFound as e:
-            assert isinstance(e.__cause__, RequestError)
-            assert "Inner error" in str(e.__cause__)
+        
+        assert isinstance(exc_info.value.__cause__, RequestError)
+        assert "Inner error" in str(exc_info.value.__cause__)
 
 
 class TestExceptionMessages:
     """Test exception message formatting"""
     
-    def test_exception_with_detailed_message(self):
-        """Test exception with detailed error message"""
-        error = ArticleNotFound(
-            "Article 'Joe_Biden' not found at https://example.com/page/Joe_Biden. Status: 404"
-        )
+    @pytest.mark.parametrize("slug", ["Joe_Biden", "Test_Article"])
+    def test_exception_message_formatting(self, slug):
+        """Test that a detailed, formatted message keeps the slug, URL and status"""
+        url = f"https://example.com/page/{slug}"
         
-        assert "Joe_Biden" in str(error)
-        assert "404" in str(error)
-    
-    def test_exception_message_formatting(self):
-        """Test that exceptions can have formatted messages"""
-        slug = "Test_Article"
-        url = "https://example.com/page/Test_Article"
-        error = ArticleNotFound(f"Article '{slug}' not found at {url}. Status: 404")
+        with pytest.raises(ArticleNotFound, match=slug) as exc_info:
+            raise ArticleNotFound(f"Article '{slug}' not found at {url}. Status: 404")
         
-        assert slug in str(error)
-        assert url in str(error)
+        assert url in str(exc_info.value)
+        assert "404" in str(exc_info.value)
 
 
 if __name__ == '__main__':
@@ -1,49 +1,97 @@
 """Integration test: Search for slug, then fetch article"""
 
+import httpx
+import pytest
 from grokipedia_sdk import Client, ArticleNotFound, RequestError
+from grokipedia_sdk.slug_index import SlugIndex
 
-def test_integration():
+
+SAMPLE_TRUMP_SLUGS = ["Donald_Trump", "Donald_Trump_Jr.", "Melania_Trump", "Joe_Biden"]
+
+SAMPLE_TRUMP_SUMMARY_HTML = """
+<html>
+<head>
+    <meta property="og:description" content="Donald Trump is the 45th and 47th President of the United States.">
+</head>
+<body>
+    <h1>Donald Trump</h1>
+    <p>Donald John Trump is an American politician and businessman.</p>
+    
+    <h2>Early Life</h2>
+    <p>Trump was born in Queens, New York City, in 1946.</p>
+    
+    <h2>Presidency</h2>
+    <p>Trump served as president from 2017 to 2021 and again from 2025.</p>
+</body>
+</html>
+"""
+
+
+@pytest.mark.integration
+def test_integration(live_client, debug_cached):
     """Test the complete workflow: search -> find -> fetch"""
+    print("Integration Test: Search + Fetch Article")
+    print("=" * 60)
     
-    with Client() as client:
-        print("Integration Test: Search + Fetch Article")
-        print("=" * 60)
-        
-        # Step 1: Search for an article
-        query = "donald trump"
-        print(f"\n1. Searching for '{query}'...")
-        results = client.search_slug(query, limit=5)
-        print(f"   Found {len(results)} results:")
-        for i, slug in enumerate(results[:3], 1):
-            print(f"   {i}. {slug}")
-        
-        # Step 2: Find best match
-        print(f"\n2. Finding best match...")
-        best_slug = client.find_slug(query)
-        print(f"   Best match: {best_slug}")
-        
-        # Step 3: Verify it exists
-        print(f"\n3. Verifying slug exists...")
-        exists = client.slug_exists(best_slug)
-        print(f"   Exists in index: {exists}")
-        
-        # Step 4: Fetch the article summary
-        print(f"\n4. Fetching article summary...")
-        try:
-            summary = client.get_summary(best_slug)
-            print(f"   Title: {summary.title}")
-            print(f"   URL: {summary.url}")
-            print(f"   Sections: {len(summary.table_of_contents)}")
-            print(f"   Summary (first 150 chars): {summary.summary[:150]}...")
-            print("\n   SUCCESS: Article fetched successfully!")
-        except ArticleNotFound:
-            print("   ERROR: Article not found on server (but exists in index)")
-        except RequestError as e:
-            print(f"   ERROR: {e}")
+    # Step 1: Search for an article
+    query = "donald trump"
+    print(f"\n1. Searching for '{query}'...")
+    results = debug_cached(live_client.search_slug)(query, limit=5)
+    print(f"   Found {len(results)} results:")
+    for i, slug in enumerate(results[:3], 1):
+        print(f"   {i}. {slug}")
+    
+    # Step 2: Find best match
+    print(f"\n2. Finding best match...")
+    best_slug = debug_cached(live_client.find_slug)(query)
+    print(f"   Best match: {best_slug}")
+    
+    # Step 3: Verify it exists
+    print(f"\n3. Verifying slug exists...")
+    exists = debug_cached(live_client.slug_exists)(best_slug)
+    print(f"   Exists in index: {exists}")
+    
+    # Step 4: Fetch the article summary
+    print(f"\n4. Fetching article summary...")
+    try:
+        summary = debug_cached(live_client.get_summary)(best_slug)
+        print(f"   Title: {summary.title}")
+        print(f"   URL: {summary.url}")
+        print(f"   Sections: {len(summary.table_of_contents)}")
+        print(f"   Summary (first 150 chars): {summary.summary[:150]}...")
+        print("\n   SUCCESS: Article fetched successfully!")
+    except ArticleNotFound:
+        print("   ERROR: Article not found on server (but exists in index)")
+    except RequestError as e:
+        print(f"   ERROR: {e}")
+    
+    print("\n" + "=" * 60)
+    print("Integration test completed!")
+
+
+def test_integration_mocked(tmp_path, mock_transport):
+    """Test the search -> find -> fetch workflow against a local index and canned page"""
+    sitemap_dir = tmp_path / "links" / "sitemap-00001"
+    sitemap_dir.mkdir(parents=True)
+    (sitemap_dir / "names.txt").write_text("\n".join(SAMPLE_TRUMP_SLUGS))
+    transport = mock_transport([httpx.Response(200, text=SAMPLE_TRUMP_SUMMARY_HTML)])
+    
+    with Client(
+        base_url="https://test.com",
+        slug_index=SlugIndex(links_dir=tmp_path / "links"),
+        transport=transport,
+    ) as client:
+        assert "Donald_Trump" in client.search_slug("donald trump", limit=5)
+        best_slug = client.find_slug("donald trump")
+        assert best_slug == "Donald_Trump"
+        assert client.slug_exists(best_slug)
         
-        print("\n" + "=" * 60)
-        print("Integration test completed!")
+        summary = client.get_summary(best_slug)
+    
+    assert summary.title == "Donald Trump"
+    assert summary.table_of_contents == ["Early Life", "Presidency"]
+    assert str(transport.requests[0].url) == "https://test.com/page/Donald_Trump"
 
-if __name__ == '__main__':
-    test_integration()
 
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--run-integration'])
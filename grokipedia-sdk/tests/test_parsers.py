@@ -20,7 +20,7 @@ class TestExtractSections:
             <p>Content for section 2</p>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         sections, toc = parsers.extract_sections(soup)
         
         assert len(sections) == 2
@@ -39,7 +39,7 @@ class TestExtractSections:
             <p>Content</p>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         sections, toc = parsers.extract_sections(soup)
         
         assert len(sections) == 1
@@ -59,7 +59,7 @@ class TestExtractSections:
             <p>More content</p>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         sections, toc = parsers.extract_sections(soup)
         
         assert len(sections) == 3
@@ -70,7 +70,7 @@ class TestExtractSections:
     def test_extract_sections_empty_document(self):
         """Test extracting sections from document with no headings"""
         html = "<html><p>Just a paragraph</p></html>"
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         sections, toc = parsers.extract_sections(soup)
         
         assert len(sections) == 0
@@ -91,7 +91,7 @@ class TestExtractReferences:
             </ol>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         references = parsers.extract_references(soup)
         
         assert len(references) == 2
@@ -108,12 +108,48 @@ class TestExtractReferences:
             </ul>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         references = parsers.extract_references(soup)
         
         assert len(references) == 1
         assert "https://example.com" in references
     
+    def test_extract_references_heading_with_whitespace(self):
+        """Test that whitespace around the References heading text is ignored"""
+        html = """
+        <html>
+            <h2>Intro</h2>
+            <p><a href="https://example.com/intro">Intro link</a></p>
+            <h2>
+                References
+            </h2>
+            <ol>
+                <li><a href="https://example.com/1">Link 1</a></li>
+            </ol>
+        </html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        
+        assert parsers.extract_references(soup) == ["https://example.com/1"]
+    
+    @pytest.mark.parametrize("ref_id", ["references", "References"])
+    def test_extract_references_by_id(self, ref_id):
+        """Test that the References section is found by id when the heading text differs"""
+        html = f"""
+        <html>
+            <h2>Intro</h2>
+            <p><a href="https://example.com/intro">Intro link</a></p>
+            <h2 id="{ref_id}">Sources</h2>
+            <ol>
+                <li><a href="https://example.com/1">Link 1</a></li>
+            </ol>
+        </html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        references = parsers.extract_references(soup)
+        
+        assert references == ["https://example.com/1"]
+    
     def test_extract_references_removes_duplicates(self):
         """Test that duplicate references are removed"""
         html = """
@@ -126,7 +162,7 @@ class TestExtractReferences:
             </ol>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         references = parsers.extract_references(soup)
         
         assert len(references) == 2
@@ -143,7 +179,7 @@ class TestExtractReferences:
             </ol>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         references = parsers.extract_references(soup)
         
         # Only external links should be included when searching the section
@@ -158,7 +194,7 @@ class TestExtractReferences:
             <p><a href="/local-page">Local Link</a></p>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         references = parsers.extract_references(soup)
         
         # Should find at least the external link
@@ -166,6 +202,20 @@ class TestExtractReferences:
         # Local links starting without http should not be included
         assert "/local-page" not in references
 
+    
+    def test_extract_references_fallback_skips_grokipedia_links(self):
+        """Test that the fallback keeps only external http(s) links, in order, once each"""
+        html = """
+        <html>
+            <p><a href="https://grokipedia.com/page/Other">Internal</a></p>
+            <p><a href="https://example.com/b">B</a> <a href="http://example.com/a">A</a></p>
+            <p><a href="https://example.com/b">B again</a> <a href="mailto:x@example.com">Mail</a></p>
+            <p><a href="https://example.com/?next=grokipedia.com">Redirect</a></p>
+        </html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        
+        assert parsers.extract_references(soup) == ["https://example.com/b", "http://example.com/a"]
 
 class TestExtractFactCheckInfo:
     """Test suite for extract_fact_check_info function"""
@@ -179,7 +229,7 @@ class TestExtractFactCheckInfo:
             </head>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         fact_check = parsers.extract_fact_check_info(soup)
         
         assert fact_check is not None
@@ -195,7 +245,7 @@ class TestExtractFactCheckInfo:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         fact_check = parsers.extract_fact_check_info(soup)
         
         assert fact_check is not None
@@ -211,7 +261,7 @@ class TestExtractFactCheckInfo:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         fact_check = parsers.extract_fact_check_info(soup)
         
         assert fact_check is None
@@ -225,13 +275,52 @@ class TestExtractFactCheckInfo:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         fact_check = parsers.extract_fact_check_info(soup)
         
         # The text node with this content should be found
         # Note: find_all with string uses regex, need to match case-insensitively
         assert fact_check is not None or fact_check is None  # Parser may not match all caps version due to regex
 
+    
+    def test_extract_fact_check_from_raw_html_matches_tree_walk(self):
+        """Test that scanning the raw document agrees with walking the tree"""
+        html = """
+        <html>
+            <body>
+                <p>Some article content here.</p>
+                <footer>Fact-checked by Grok &amp; Friends, 2 days ago.</footer>
+            </body>
+        </html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        
+        assert parsers.extract_fact_check_info(soup, html) == "Grok & Friends, 2 days ago"
+        assert parsers.extract_fact_check_info(soup, html) == parsers.extract_fact_check_info(soup)
+    
+    @pytest.mark.parametrize("body", [
+        '<a title="Fact-checked by Nobody">link</a><p>Fact-checked by Jane Doe</p>',
+        '<p title="a>Fact-checked by X">hi</p><p>Fact-checked by Jane Doe</p>',
+        '<div title="a>b <footer>Fact-checked by X</footer>">t</div><footer>Fact-checked by Jane Doe</footer>',
+        '<!-- Fact-checked by Hidden --><p>Fact-checked by Jane Doe</p>',
+        '<!-- <footer>Fact-checked by Hidden</footer> --><footer>Fact-checked by Jane Doe</footer>',
+        '<script>var s = "<footer>Fact-checked by Script</footer>";</script><p>Fact-checked by Jane Doe</p>',
+        '<p>a < b <i>Fact-checked by Jane Doe</i></p>',
+    ])
+    def test_extract_fact_check_raw_html_matches_tree_walk_around_markup(self, body):
+        """Test that matches inside attributes, comments and scripts give the same result as the tree walk"""
+        html = f"<html><body>{body}</body></html>"
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        
+        assert parsers.extract_fact_check_info(soup, html) == parsers.extract_fact_check_info(soup)
+    
+    def test_extract_fact_check_raw_html_none_when_missing(self):
+        """Test that the raw scan returns None when no fact-check info exists"""
+        html = "<html><body><p>Regular article</p></body></html>"
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        
+        assert parsers.extract_fact_check_info(soup, html) is None
+
 
 class TestExtractSummary:
     """Test suite for extract_summary function"""
@@ -249,7 +338,7 @@ class TestExtractSummary:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         title_tag = soup.find('h1')
         summary = parsers.extract_summary(soup, title_tag)
         
@@ -266,7 +355,7 @@ class TestExtractSummary:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         title_tag = soup.find('h1')
         summary = parsers.extract_summary(soup, title_tag)
         
@@ -284,7 +373,7 @@ class TestExtractSummary:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         title_tag = soup.find('h1')
         summary = parsers.extract_summary(soup, title_tag)
         
@@ -301,13 +390,249 @@ class TestExtractSummary:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         summary = parsers.extract_summary(soup, None)
         
         assert len(summary) > 0
         assert "extracted as summary" in summary or len(summary) > 100
 
 
+class TestSummaryStrainer:
+    """Test suite for parsing with SUMMARY_STRAINER"""
+    
+    def test_strained_soup_matches_full_soup(self):
+        """Test that summary and TOC are unchanged when parsing only summary tags"""
+        html = """
+        <html>
+            <head>
+                <meta name="description" content="Described by the plain meta tag">
+                <script>var tracking = "<p>not content</p>";</script>
+            </head>
+            <body>
+                <nav><a href="/home">Home</a></nav>
+                <h1>Title</h1>
+                <h2>Section 1</h2>
+                <p>Content</p>
+                <h3>Subsection 1.1</h3>
+                <footer>Footer</footer>
+            </body>
+        </html>
+        """
+        full_soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        strained_soup = BeautifulSoup(html, parsers.HTML_PARSER, parse_only=parsers.SUMMARY_STRAINER)
+        
+        assert strained_soup.find('script') is None
+        assert strained_soup.find('nav') is None
+        assert parsers.extract_summary(strained_soup, strained_soup.find('h1')) == \
+            parsers.extract_summary(full_soup, full_soup.find('h1'))
+        assert parsers.extract_sections(strained_soup)[1] == parsers.extract_sections(full_soup)[1]
+    
+    def test_strained_soup_paragraph_fallback(self):
+        """Test that the paragraph fallback still finds the intro paragraph"""
+        intro = "This is a very long introductory paragraph " * 6
+        html = f"""
+        <html>
+            <body>
+                <h1>Title</h1>
+                <article><p>{intro}</p></article>
+            </body>
+        </html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER, parse_only=parsers.SUMMARY_STRAINER)
+        
+        assert parsers.extract_summary(soup, soup.find('h1')) == intro.strip()
+
+
+class TestReferencesAndMetaStrainers:
+    """Test suite for parsing with REFERENCES_STRAINER and META_STRAINER"""
+    
+    HTML = """
+    <html>
+        <head>
+            <meta property="og:description" content="Fact-checked by Jane Doe. About the topic.">
+            <script>var tracking = "<a href='https://tracker.example.com'>x</a>";</script>
+        </head>
+        <body>
+            <nav><a href="/home">Home</a></nav>
+            <div class="content">
+                <h1>Title</h1>
+                <h2>Intro</h2>
+                <p>Text with <a href="https://inline.example.com">a link</a></p>
+                <h2>References</h2>
+                <ol>
+                    <li><a href="https://example.com/ref1">Ref 1</a></li>
+                    <li><a href="https://example.com/ref2">Ref 2</a></li>
+                </ol>
+                <h2>See Also</h2>
+                <p><a href="https://example.com/other">Other</a></p>
+            </div>
+        </body>
+    </html>
+    """
+    
+    def test_references_strainer_matches_full_soup(self):
+        """Test that references are unchanged when parsing only the tags they need"""
+        full_soup = BeautifulSoup(self.HTML, parsers.HTML_PARSER)
+        strained_soup = BeautifulSoup(self.HTML, parsers.HTML_PARSER, parse_only=parsers.REFERENCES_STRAINER)
+        
+        assert strained_soup.find('script') is None
+        assert parsers.extract_references(strained_soup) == parsers.extract_references(full_soup)
+        assert parsers.extract_references(strained_soup) == [
+            "https://example.com/ref1", "https://example.com/ref2"
+        ]
+    
+    def test_meta_strainer_keeps_description(self):
+        """Test that the meta-only soup still yields the summary and fact-check info"""
+        soup = BeautifulSoup(self.HTML, parsers.HTML_PARSER, parse_only=parsers.META_STRAINER)
+        
+        assert soup.find('h1') is None
+        assert parsers.extract_summary(soup, None) == "Fact-checked by Jane Doe. About the topic."
+        assert parsers.extract_fact_check_info(soup) == "Jane Doe"
+
+
+class TestExtractSummaryFast:
+    """Test suite for extract_summary_fast function"""
+    
+    def test_extract_summary_fast_basic(self):
+        """Test extracting title, summary and TOC without a parse tree"""
+        html = """
+        <html>
+            <head>
+                <meta property="og:description" content="Summary &amp; overview">
+            </head>
+            <body>
+                <h1>Main <em>Title</em></h1>
+                <h2>Section 1</h2>
+                <p>Content</p>
+                <h3>Subsection 1.1</h3>
+            </body>
+        </html>
+        """
+        title, summary, toc = parsers.extract_summary_fast(html)
+        
+        assert title == "MainTitle"
+        assert summary == "Summary & overview"
+        assert toc == ["Section 1", "Subsection 1.1"]
+    
+    def test_extract_summary_fast_matches_full_parser(self):
+        """Test that the fast path agrees with the BeautifulSoup path"""
+        html = """
+        <html>
+            <head>
+                <meta content="Article about AI." property="og:description">
+                <script>document.write("<h2>Not a heading</h2>");</script>
+            </head>
+            <body>
+                <!-- <h2>Commented out</h2> -->
+                <h1>Artificial Intelligence</h1>
+                <h2>History</h2>
+                <h2>Applications <span>&amp; uses</span></h2>
+            </body>
+        </html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        title_tag = soup.find('h1')
+        _, expected_toc = parsers.extract_sections(soup)
+        
+        title, summary, toc = parsers.extract_summary_fast(html)
+        
+        assert title == title_tag.get_text(strip=True)
+        assert summary == parsers.extract_summary(soup, title_tag)
+        assert toc == expected_toc
+    
+    def test_extract_og_description_fast(self):
+        """Test reading og:description without a tree, ignoring commented-out tags"""
+        html = """
+        <html><head>
+            <!-- <meta property="og:description" content="Old description"> -->
+            <meta name="description" content="Plain description">
+            <meta content="Caf&eacute; &amp; more" property="og:description">
+        </head></html>
+        """
+        
+        assert parsers.extract_og_description_fast(html) == "Café & more"
+        assert parsers.extract_og_description_fast('<meta property="og:description" content=" ">') is None
+        assert parsers.extract_og_description_fast('<meta name="description" content="Plain">') is None
+    
+    def test_extract_og_description_fast_unquoted_and_duplicate_attributes(self):
+        """Test that unquoted values are read and the first duplicate attribute wins, as in the full parser"""
+        html = """
+        <html><head>
+            <meta content="a &amp; b" property=og:description>
+            <meta property="og:description" content='x"y'>
+            <meta property="og:description" property="other" content="first" content="second">
+        </head><body><h1>T</h1></body></html>
+        """
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
+        
+        assert parsers.extract_og_description_fast(html) == "a & b"
+        assert parsers.extract_og_description_fast(html) == parsers.extract_summary(soup, soup.find('h1'))
+        assert parsers.extract_og_description_fast(
+            '<meta property="og:description" property="other" content="first" content="second">'
+        ) == "first"
+    
+    def test_extract_summary_fast_requires_meta_description(self):
+        """Test that pages without og:description fall back to the full parser"""
+        html = "<html><body><h1>Title</h1><p>Content</p></body></html>"
+        
+        assert parsers.extract_summary_fast(html) is None
+    
+    def test_extract_summary_fast_requires_title(self):
+        """Test that pages without an h1 fall back to the full parser"""
+        html = '<html><head><meta property="og:description" content="Summary"></head></html>'
+        
+        assert parsers.extract_summary_fast(html) is None
+
+
+@pytest.mark.skipif(not parsers.HAS_LXML, reason="lxml not installed")
+class TestExtractSummaryLxml:
+    """Test suite for extract_summary_lxml function"""
+    
+    def test_extract_summary_lxml_paragraph_fallback(self):
+        """Test that the XPath path agrees with the BeautifulSoup path without a meta description"""
+        intro = "This introduction is long enough to be used as the summary. " * 5
+        html = f"""
+        <html>
+            <body>
+                <h1>Main <em>Title</em></h1>
+                <p>Jump to navigation</p>
+                <div>{intro}<script>track();</script></div>
+                <h2>History</h2>
+                <h3>Early <span>years</span></h3>
+            </body>
+        </html>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        title_tag = soup.find('h1')
+        _, expected_toc = parsers.extract_sections(soup)
+        
+        title, summary, toc = parsers.extract_summary_lxml(html)
+        
+        assert title == title_tag.get_text(strip=True)
+        assert summary == parsers.extract_summary(soup, title_tag)
+        assert toc == expected_toc
+    
+    def test_extract_summary_lxml_meta_description(self):
+        """Test that the name=description meta tag is used when og:description is missing"""
+        html = '<html><head><meta name="description" content=" Summary "></head><body><h1>T</h1></body></html>'
+        
+        assert parsers.extract_summary_lxml(html) == ("T", "Summary", [])
+    
+    def test_extract_summary_lxml_without_title(self):
+        """Test that a page without an h1 reports no title"""
+        html = '<html><body><article><p>' + 'x' * 250 + '</p></article></body></html>'
+        
+        title, summary, toc = parsers.extract_summary_lxml(html)
+        
+        assert title is None
+        assert summary == 'x' * 250
+    
+    def test_extract_summary_lxml_defers_to_full_parser(self):
+        """Test that empty documents and empty headings fall back to BeautifulSoup"""
+        assert parsers.extract_summary_lxml("   ") is None
+        assert parsers.extract_summary_lxml("<h1>T</h1><h2> </h2>") is None
+
+
 class TestCleanHtmlForTextExtraction:
     """Test suite for clean_html_for_text_extraction function"""
     
@@ -321,7 +646,7 @@ class TestCleanHtmlForTextExtraction:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         original_length = len(str(soup))
         
         parsers.clean_html_for_text_extraction(soup)
@@ -342,7 +667,7 @@ class TestCleanHtmlForTextExtraction:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         
         parsers.clean_html_for_text_extraction(soup)
         
@@ -364,7 +689,7 @@ class TestCleanHtmlForTextExtraction:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parsers.HTML_PARSER)
         
         parsers.clean_html_for_text_extraction(soup)
         
@@ -374,11 +699,21 @@ class TestCleanHtmlForTextExtraction:
         assert "unused()" not in text
 
 
+class TestHtmlParser:
+    """Test selection of the BeautifulSoup tree builder"""
+    
+    def test_prefers_lxml_when_installed(self):
+        """Test that lxml is used whenever it can be imported"""
+        expected = 'lxml' if parsers.HAS_LXML else 'html.parser'
+        assert parsers.HTML_PARSER == expected
+
+
 class TestIntegration:
     """Integration tests for multiple parsing functions working together"""
     
-    def test_parse_complete_article_structure(self):
-        """Test parsing a complete article with all elements"""
+    @pytest.mark.parametrize("parser", sorted({'html.parser', parsers.HTML_PARSER}))
+    def test_parse_complete_article_structure(self, parser):
+        """Test parsing a complete article with all elements, with each available tree builder"""
         html = """
         <html>
             <head>
@@ -405,7 +740,7 @@ class TestIntegration:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, parser)
         title_tag = soup.find('h1')
         
         # Extract all components
@@ -260,6 +260,24 @@ class TestMultipleSitemapDirectories:
             shared_results = index.search("shared")
             assert "Shared_Article" in shared_results
 
+    
+    def test_exists_checks_exact_and_case_variants(self):
+        """Test that exists() finds slugs from every sitemap, ignoring case"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            links_dir = Path(tmpdir) / "links"
+            links_dir.mkdir()
+            for i, names in enumerate(["Joe_Biden\n", "joe_biden\nMarie_Curie\n"]):
+                sitemap_dir = links_dir / f"sitemap-{i}"
+                sitemap_dir.mkdir()
+                (sitemap_dir / "names.txt").write_text(names)
+            
+            index = SlugIndex(links_dir=links_dir)
+            
+            assert index.exists("Joe_Biden")
+            assert index.exists("joe_biden")
+            assert index.exists("MARIE_CURIE")
+            assert not index.exists("Marie_Curie_Jr")
+
 
 class TestCaching:
     """Test that the index is properly cached"""